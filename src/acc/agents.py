@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from typing import Protocol
+from typing import Mapping, Protocol
 
 
 class AgentDetector(Protocol):
@@ -30,11 +30,42 @@ class AgentDetector(Protocol):
         """Regex patterns that indicate the agent is actively working."""
         ...
 
+    @property
+    def prefilter_literals(self) -> Mapping[re.Pattern, tuple[str, ...]]:
+        """Per pattern, strings of which every match contains at least one.
+
+        A pattern is only run on text containing one of its literals
+        (compared case-insensitively for IGNORECASE patterns); patterns
+        without an entry always run.
+        """
+        ...
+
 
 # ──────────────────────────────────────────────────────────────────
 # Built-in agent detectors
 # ──────────────────────────────────────────────────────────────────
 
+# Prefilter literals of every built-in pattern, filled in by `_gated`
+_BUILTIN_LITERALS: dict[re.Pattern, tuple[str, ...]] = {}
+
+
+def _gated(regex: str, flags: int = 0, *, literals: tuple[str, ...]) -> re.Pattern:
+    """Compile a built-in pattern and declare its prefilter literals."""
+    pattern = re.compile(regex, flags)
+    _BUILTIN_LITERALS[pattern] = literals
+    return pattern
+
+
+# Indicators shared by several agents, compiled once and referenced from
+# each detector's pattern lists
+_QUESTION = _gated(r"\?\s*$", re.MULTILINE, literals=("?",))
+_YES_NO = _gated(r"(?:Y/n|y/N|yes/no)", re.IGNORECASE, literals=("y/n", "yes/no"))
+_PROMPT = _gated(r"^[❯>›\$]\s*$", re.MULTILINE, literals=("❯", ">", "›", "$"))
+_PROCEED = _gated(r"Do you want to proceed", re.IGNORECASE, literals=("do you want to proceed",))
+_SPINNER = _gated(r"⠋|⠙|⠹|⠸|⠼|⠴|⠦|⠧|⠇|⠏", literals=tuple("⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"))
+_ELLIPSIS = _gated(r"\.{3,}", literals=("...",))
+_BLOCKS = _gated(r"█|▓|▒|░", literals=tuple("█▓▒░"))
+
 
 class ClaudeDetector:
     """Detector for Claude Code CLI sessions."""
@@ -43,19 +74,21 @@ class ClaudeDetector:
     process_names = ["claude"]
 
     attention_patterns = [
-        re.compile(r"\?\s*$", re.MULTILINE),
-        re.compile(r"(?:Y/n|y/N|yes/no)", re.IGNORECASE),
-        re.compile(r"\(Y\)es.*\(N\)o", re.IGNORECASE),
-        re.compile(r"^[❯>›]\s*$", re.MULTILINE),
-        re.compile(r"Do you want to proceed", re.IGNORECASE),
+        _QUESTION,
+        _YES_NO,
+        _gated(r"\(Y\)es.*\(N\)o", re.IGNORECASE, literals=("(y)es",)),
+        _gated(r"^[❯>›]\s*$", re.MULTILINE, literals=("❯", ">", "›")),
+        _PROCEED,
     ]
 
     working_patterns = [
-        re.compile(r"⠋|⠙|⠹|⠸|⠼|⠴|⠦|⠧|⠇|⠏"),
-        re.compile(r"\.{3,}"),
-        re.compile(r"█|▓|▒|░"),
+        _SPINNER,
+        _ELLIPSIS,
+        _BLOCKS,
     ]
 
+    prefilter_literals = _BUILTIN_LITERALS
+
 
 class OpenCodeDetector:
     """Detector for OpenCode sessions."""
@@ -64,19 +97,24 @@ class OpenCodeDetector:
     process_names = ["opencode"]
 
     attention_patterns = [
-        re.compile(r"\?\s*$", re.MULTILINE),
-        re.compile(r"(?:Y/n|y/N|yes/no)", re.IGNORECASE),
-        re.compile(r"^[❯>›\$]\s*$", re.MULTILINE),
-        re.compile(r"Enter.*to continue", re.IGNORECASE),
-        re.compile(r"waiting for input", re.IGNORECASE),
+        _QUESTION,
+        _YES_NO,
+        _PROMPT,
+        _gated(r"Enter.*to continue", re.IGNORECASE, literals=("to continue",)),
+        _gated(r"waiting for input", re.IGNORECASE, literals=("waiting for input",)),
     ]
 
     working_patterns = [
-        re.compile(r"⠋|⠙|⠹|⠸|⠼|⠴|⠦|⠧|⠇|⠏"),
-        re.compile(r"thinking|generating|processing", re.IGNORECASE),
-        re.compile(r"█|▓|▒|░"),
+        _SPINNER,
+        _gated(
+            r"thinking|generating|processing", re.IGNORECASE,
+            literals=("thinking", "generating", "processing"),
+        ),
+        _BLOCKS,
     ]
 
+    prefilter_literals = _BUILTIN_LITERALS
+
 
 class CodexDetector:
     """Detector for OpenAI Codex CLI sessions."""
@@ -85,18 +123,23 @@ class CodexDetector:
     process_names = ["codex"]
 
     attention_patterns = [
-        re.compile(r"\?\s*$", re.MULTILINE),
-        re.compile(r"(?:Y/n|y/N|yes/no)", re.IGNORECASE),
-        re.compile(r"^[❯>›\$]\s*$", re.MULTILINE),
-        re.compile(r"approve|reject|deny", re.IGNORECASE),
+        _QUESTION,
+        _YES_NO,
+        _PROMPT,
+        _gated(r"approve|reject|deny", re.IGNORECASE, literals=("approve", "reject", "deny")),
     ]
 
     working_patterns = [
-        re.compile(r"⠋|⠙|⠹|⠸|⠼|⠴|⠦|⠧|⠇|⠏"),
-        re.compile(r"running|executing|reading", re.IGNORECASE),
-        re.compile(r"█|▓|▒|░"),
+        _SPINNER,
+        _gated(
+            r"running|executing|reading", re.IGNORECASE,
+            literals=("running", "executing", "reading"),
+        ),
+        _BLOCKS,
     ]
 
+    prefilter_literals = _BUILTIN_LITERALS
+
 
 class AiderDetector:
     """Detector for Aider sessions."""
@@ -105,17 +148,19 @@ class AiderDetector:
     process_names = ["aider"]
 
     attention_patterns = [
-        re.compile(r"\?\s*$", re.MULTILINE),
-        re.compile(r"(?:Y/n|y/N|yes/no)", re.IGNORECASE),
-        re.compile(r"^[❯>›\$]\s*$", re.MULTILINE),
-        re.compile(r"^aider>", re.MULTILINE),
+        _QUESTION,
+        _YES_NO,
+        _PROMPT,
+        _gated(r"^aider>", re.MULTILINE, literals=("aider>",)),
     ]
 
     working_patterns = [
-        re.compile(r"⠋|⠙|⠹|⠸|⠼|⠴|⠦|⠧|⠇|⠏"),
-        re.compile(r"Tokens:|Model:", re.IGNORECASE),
+        _SPINNER,
+        _gated(r"Tokens:|Model:", re.IGNORECASE, literals=("tokens:", "model:")),
     ]
 
+    prefilter_literals = _BUILTIN_LITERALS
+
 
 class GeminiDetector:
     """Detector for Gemini CLI and Antigravity CLI sessions."""
@@ -124,20 +169,25 @@ class GeminiDetector:
     process_names = ["gemini", "antigravity"]
 
     attention_patterns = [
-        re.compile(r"\?\s*$", re.MULTILINE),
-        re.compile(r"(?:Y/n|y/N|yes/no)", re.IGNORECASE),
-        re.compile(r"^[❯>›\$]\s*$", re.MULTILINE),
-        re.compile(r"Do you want to proceed", re.IGNORECASE),
-        re.compile(r"waiting for approval", re.IGNORECASE),
+        _QUESTION,
+        _YES_NO,
+        _PROMPT,
+        _PROCEED,
+        _gated(r"waiting for approval", re.IGNORECASE, literals=("waiting for approval",)),
     ]
 
     working_patterns = [
-        re.compile(r"⠋|⠙|⠹|⠸|⠼|⠴|⠦|⠧|⠇|⠏"),
-        re.compile(r"\.{3,}"),
-        re.compile(r"█|▓|▒|░"),
-        re.compile(r"Generating|Thinking|Planning", re.IGNORECASE),
+        _SPINNER,
+        _ELLIPSIS,
+        _BLOCKS,
+        _gated(
+            r"Generating|Thinking|Planning", re.IGNORECASE,
+            literals=("generating", "thinking", "planning"),
+        ),
     ]
 
+    prefilter_literals = _BUILTIN_LITERALS
+
 
 # ──────────────────────────────────────────────────────────────────
 # Custom detector from config
@@ -152,6 +202,8 @@ class CustomAgentDetector:
     process_names: list[str] = field(default_factory=list)
     attention_patterns: list[re.Pattern] = field(default_factory=list)
     working_patterns: list[re.Pattern] = field(default_factory=list)
+    # Config patterns declare none, so they always run
+    prefilter_literals: dict[re.Pattern, tuple[str, ...]] = field(default_factory=dict)
 
     @classmethod
     def from_config(cls, cfg: dict) -> CustomAgentDetector:
@@ -189,6 +241,10 @@ class AgentRegistry:
         if custom_configs:
             for cfg in custom_configs:
                 self.detectors.append(CustomAgentDetector.from_config(cfg))
+        # Lowercased (process name, detector) pairs in detector priority order
+        self._name_index: list[tuple[str, AgentDetector]] = [
+            (n.lower(), d) for d in self.detectors for n in d.process_names
+        ]
 
     def all_process_names(self) -> list[str]:
         """Get all process names across all detectors."""
@@ -197,11 +253,20 @@ class AgentRegistry:
             names.extend(d.process_names)
         return names
 
+    def match_process(self, name: str, cmdline: str) -> AgentDetector | None:
+        """The detector for a process whose name or command line mentions an agent."""
+        # One lowercased haystack; the NUL keeps needles from spanning both parts
+        haystack = f"{name}\0{cmdline}".lower()
+        for needle, _ in self._name_index:
+            if needle in haystack:
+                return self.find_detector(needle)
+        return None
+
     def find_detector(self, process_name: str) -> AgentDetector | None:
         """Find the detector that matches a given process name."""
         process_name_lower = process_name.lower()
-        for d in self.detectors:
-            if any(n.lower() in process_name_lower for n in d.process_names):
+        for needle, d in self._name_index:
+            if needle in process_name_lower:
                 return d
         return None
 
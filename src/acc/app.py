@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import subprocess
 import time
-import webbrowser
 
-from textual.app import App, ComposeResult
+from textual.app import App, ComposeResult, SuspendNotSupported
 from textual.binding import Binding
 from textual.containers import Vertical
 from textual.screen import ModalScreen
@@ -16,18 +16,35 @@ from textual.widgets import ContentSwitcher, Footer, Input, Label, Static
 from acc.agents import AgentRegistry
 from acc.columns import create_default_registry
 from acc.config import ACCConfig
-from acc.discovery import SessionRegistry, capture_pane, discover_panes
+from acc.discovery import SessionRegistry, capture_panes_bulk_async, discover_panes
 from acc.links import LinkRegistry
 from acc.notifications import NotificationManager
 from acc.spawner import spawn_session
-from acc.status import SessionStatus, content_changed, detect_status
+from acc.status import SessionStatus, classify_content, content_changed, resolve_status
 from acc.summarizer import Summarizer
+from acc.text import tail_lines
+from acc.tmux_client import control as tmux_control
 from acc.widgets.detail_panel import DetailPanel
 from acc.widgets.header import ACCHeader
 from acc.widgets.grid import SessionGrid
 from acc.widgets.session_table import SessionSelected, SessionTable
 
 
+# Statuses that stay put while a pane's output is unchanged; _poll only
+# re-evaluates such sessions every _STATUS_RECHECK_SECONDS.
+_SETTLED_STATUSES = frozenset(
+    {SessionStatus.IDLE, SessionStatus.DONE, SessionStatus.CRASHED}
+)
+_STATUS_RECHECK_SECONDS = 5.0
+
+# Adaptive polling: after this many consecutive polls with no pane output
+# changes, the poll interval doubles each tick until output changes or the
+# user does something. Capped relative to refresh_interval so a pane that
+# wakes up is still noticed within a few regular ticks.
+_IDLE_TICKS_BEFORE_BACKOFF = 5
+_MAX_BACKOFF_FACTOR = 4
+
+
 # ──────────────────────────────────────────────────────────────────
 # Spawn dialog — multi-step modal for creating new sessions
 # ──────────────────────────────────────────────────────────────────
@@ -384,6 +401,8 @@ class ACCApp(App):
     def __init__(self) -> None:
         super().__init__()
         self.config = ACCConfig.load()
+        # acc never chdirs, so the launch directory is the spawn fallback
+        self._initial_cwd = os.getcwd()
         self.registry = SessionRegistry()
         self.agent_registry = AgentRegistry(self.config.agents)
         self.link_registry = LinkRegistry(self.config.links)
@@ -396,8 +415,11 @@ class ACCApp(App):
             base_url=self.config.llm_base_url,
             provider=self.config.llm_provider,
         )
-        self.pending_tasks: set[str] = set()
         self._poll_timer = None
+        self._backoff_timer = None
+        self._idle_ticks = 0
+        self._polling = False
+        self._poll_again = False
 
     def compose(self) -> ComposeResult:
         yield ACCHeader()
@@ -415,60 +437,141 @@ class ACCApp(App):
             self.config.refresh_interval, self._poll
         )
 
-    def _background_summarize(self, pane_id: str, content: str) -> None:
-        """Run summarization in a worker thread."""
+    def on_unmount(self) -> None:
+        self.summarizer.close()
+        tmux_control.close()
+
+    async def run_action(self, action, default_namespace=None, namespaces=None) -> bool:
+        # Any user action restores the normal poll rate
+        self._wake_polling()
+        return await super().run_action(action, default_namespace, namespaces)
+
+    def _wake_polling(self) -> None:
+        """Reset idle tracking and switch back to the regular poll interval."""
+        self._idle_ticks = 0
+        if self._backoff_timer is not None:
+            self._backoff_timer.stop()
+            self._backoff_timer = None
+            if self._poll_timer is not None:
+                self._poll_timer.resume()
+
+    def _update_poll_rate(self, any_changed: bool) -> None:
+        """Back off polling while every pane is quiet; snap back on output."""
+        if any_changed:
+            self._wake_polling()
+            return
+
+        self._idle_ticks += 1
+        backoff_ticks = self._idle_ticks - _IDLE_TICKS_BEFORE_BACKOFF
+        if backoff_ticks <= 0 or self._poll_timer is None:
+            return
+
+        # Replace the regular interval with a growing one-shot delay
+        self._poll_timer.pause()
+        if self._backoff_timer is not None:
+            self._backoff_timer.stop()
+        factor = min(2 ** min(backoff_ticks, 10), _MAX_BACKOFF_FACTOR)
+        delay = self.config.refresh_interval * factor
+        self._backoff_timer = self.set_timer(delay, self._poll)
+
+    def _poll(self) -> None:
+        """Kick off a poll in an async worker, or queue one if it's busy.
+
+        A slow poll is left to finish rather than cancelled: cancelling
+        can't stop its discover_panes thread, so they would pile up. A
+        poll asked for meanwhile (e.g. right after sending input) runs
+        once it's done, so the refresh isn't lost.
+        """
+        if self._polling:
+            self._poll_again = True
+            return
+        self._polling = True
+        self.run_worker(self._poll_async(), group="poll")
+
+    async def _poll_async(self) -> None:
+        """Run polls until none was asked for during the last one."""
         try:
-            # force=True because we already checked should_refresh before calling this
-            self.summarizer.summarize(pane_id, content, force=True)
-        except Exception:
-            pass
+            while True:
+                self._poll_again = False
+                await self._poll_once()
+                if not self._poll_again:
+                    break
         finally:
-            self.pending_tasks.discard(pane_id)
+            self._polling = False
 
-    def _poll(self) -> None:
+    async def _poll_once(self) -> None:
         """Discover sessions, update statuses, and refresh the UI."""
-        # Discover panes
-        discovered = discover_panes(self.agent_registry)
+        # Discover panes; list-panes plus the psutil process-tree walks block,
+        # so they run on a worker thread instead of stalling the UI
+        discovered = await asyncio.to_thread(discover_panes, self.agent_registry)
         sessions = self.registry.update(discovered)
 
+        # Batched tmux calls capture the panes without blocking the UI; the
+        # status/link view is the last 50 lines of the 200-line capture the
+        # summarizer gets. Panes tmux reports no activity for since their
+        # last capture keep it.
+        stale = [pane_id for pane_id, s in sessions.items() if not s.capture_is_current()]
+        capture_started = time.time()
+        captures = await capture_panes_bulk_async(stale, lines=200)
+        for pane_id in stale:
+            session = sessions[pane_id]
+            session.last_capture = captures.get(pane_id, "")
+            session.captured_activity = session.activity
+            session.captured_at = capture_started
+
         # Update each session's status, links, and summary
+        now = time.time()
+        any_changed = False
+        to_refresh, cached_summaries = self.summarizer.partition(sessions)
+        to_refresh = set(to_refresh)
         for pane_id, session in sessions.items():
-            content = capture_pane(pane_id, lines=50)
+            long_content = session.last_capture
+            content = tail_lines(long_content, 50)
+            changed, new_hash = content_changed(
+                session.last_content_hash, content, session.content_preview
+            )
             session.content_preview = content
-            changed, new_hash = content_changed(session.last_content_hash, content)
 
             if changed:
-                session.last_output_time = time.time()
+                any_changed = True
+                session.last_output_time = now
                 session.last_content_hash = new_hash
 
                 # Update links
-                session.links = self.link_registry.scan(content)
-
-            # Detect status using agent-specific detector
-            session.status = detect_status(
-                pane_content=content,
-                agent_running=session.agent_running,
-                exit_code=session.exit_code,
-                last_output_time=session.last_output_time,
-                detector=session.detector,
+                session.links = self.link_registry.scan_cached(new_hash, content)
+
+            # A quiet pane in a settled state keeps its status until its
+            # output changes (re-checked every few seconds); its summary
+            # below still gets dispatched and merged
+            settled = (
+                not changed
+                and session.status in _SETTLED_STATUSES
+                and now - session.last_status_check < _STATUS_RECHECK_SECONDS
             )
+            if not settled:
+                # Detect status using agent-specific detector; the pattern scan
+                # only reruns when the content (or detector) changed
+                status_key = (new_hash, session.detector)
+                if session.content_status_key != status_key:
+                    session.content_status = classify_content(content, session.detector)
+                    session.content_status_key = status_key
+                session.status = resolve_status(
+                    session.content_status,
+                    agent_running=session.agent_running,
+                    exit_code=session.exit_code,
+                    last_output_time=session.last_output_time,
+                )
+                session.last_status_check = now
 
             # LLM summarization (async-friendly — runs in background)
             # 1. Check if we should start a new summarization task
-            if (
-                pane_id not in self.pending_tasks
-                and self.summarizer.should_refresh(pane_id)
-            ):
-                self.pending_tasks.add(pane_id)
-                long_content = capture_pane(pane_id, lines=200)
-                
-                def job():
-                    self._background_summarize(pane_id, long_content)
-
-                self.run_worker(job, thread=True, group="summarizer")
-
-            # 2. Always update session from cache if available (worker populates cache)
-            if cached := self.summarizer.get_cached(pane_id):
+            if pane_id in to_refresh:
+                # force=True because partition already decided it's due;
+                # panes with a request already in flight are skipped
+                self.summarizer.summarize_background(pane_id, long_content, force=True)
+
+            # 2. Always update session from cache if available (the pool populates it)
+            if cached := cached_summaries.get(pane_id):
                 session.goal = session.goal or cached.goal
                 session.progress = session.progress or cached.progress
 
@@ -477,31 +580,34 @@ class ACCApp(App):
         if alerting:
             self.notifications.ring_bell()
 
-        # Update UI
+        # Update UI (batched so the whole refresh is a single repaint)
         try:
-            header = self.query_one(ACCHeader)
-            header.update_counts(len(sessions), self.notifications.badge_count)
-
-            table = self.query_one(SessionTable)
-            table.refresh_sessions(sessions)
-
-            try:
-                grid = self.query_one(SessionGrid)
-                grid.refresh_sessions(sessions)
-            except Exception:
-                pass
-
-            # Update detail panel for current selection
-            # Only if table is visible? 
-            # If grid is visible, selection might not sync yet.
-            # For now, let's keep detail panel updating based on table selection.
-            selected = table.get_selected_session()
-            detail = self.query_one(DetailPanel)
-            detail.show_session(selected)
+            with self.batch_update():
+                table = self.query_one(SessionTable)
+                table.refresh_sessions(sessions)
+
+                try:
+                    grid = self.query_one(SessionGrid)
+                    grid.refresh_sessions(sessions)
+                except Exception:
+                    pass
+
+                # Update detail panel for current selection
+                # Only if table is visible? 
+                # If grid is visible, selection might not sync yet.
+                # For now, let's keep detail panel updating based on table selection.
+                selected = table.get_selected_session()
+                detail = self.query_one(DetailPanel)
+                detail.show_session(selected)
+
+                header = self.query_one(ACCHeader)
+                header.update_counts(len(sessions), self.notifications.badge_count)
         except Exception:
             # UI elements might be unmounted (e.g. during exit)
             pass
 
+        self._update_poll_rate(any_changed)
+
     # ── Keybinding actions ───────────────────────────────────────
 
     def on_session_selected(self, message: SessionSelected) -> None:
@@ -533,9 +639,17 @@ class ACCApp(App):
         self.notifications.clear_attention(session.pane_id)
         session.needs_attention_notified = False
 
-        # Exit the TUI, then __main__.py will switch the tmux window
-        # and restart acc so it's ready when the user comes back.
-        self.exit(result=("jump", session.pane_id, session.session_name))
+        # Hand the terminal to tmux; acc resumes as-is when the user detaches
+        try:
+            with self.suspend():
+                _attach_to_tmux_pane(session.pane_id, session.session_name)
+        except SuspendNotSupported:
+            self.notify("Can't suspend in this terminal to jump to the pane", severity="error")
+            return
+
+        # Catch up on whatever happened while we were away
+        self._wake_polling()
+        self._poll()
 
     def action_send_input(self) -> None:
         """Open input dialog to send text to the selected session."""
@@ -554,19 +668,38 @@ class ACCApp(App):
         """Send text to the tmux pane."""
         if not text:
             return
-        
-        # Send text + Enter to the pane
-        subprocess.run(
-            ["tmux", "send-keys", "-t", pane_id, text, "Enter"],
-            check=False,
-        )
+
+        self._send_keys(pane_id, text)
         # Force a refresh to see the reaction
         self._poll()
 
+    def _send_keys(self, pane_id: str, text: str) -> None:
+        """Send text + Enter to a pane, over control mode when possible.
+
+        A queued command isn't a sent one: its outcome is checked when tmux
+        answers, falling back to a one-off `tmux send-keys` if the control
+        client went away first.
+        """
+        args = ["tmux", "send-keys", "-t", pane_id, "--", text, "Enter"]
+        future = tmux_control.submit(*args[1:])
+        if future is None:
+            subprocess.run(args, check=False)
+            return
+        future.add_done_callback(lambda f: self._check_send_keys(f.result(), args))
+
+    def _check_send_keys(self, result: tuple[bool, str] | None, args: list[str]) -> None:
+        """Handle a control-mode send-keys answer (runs on the reader thread)."""
+        if result is None:
+            # Don't block the reader thread on the fallback
+            subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        elif not result[0]:
+            # notify() is safe to call from other threads
+            self.notify(f"Couldn't send to the pane: {result[1]}", severity="error")
+
     def action_spawn(self) -> None:
         """Open the spawn dialog to create a new Agent session."""
         recent = self.config.recent_dirs
-        default_dir = recent[0] if recent else os.getcwd()
+        default_dir = recent[0] if recent else self._initial_cwd
         self.push_screen(SpawnDialog(default_dir), callback=self._on_spawn_result)
 
     def _on_spawn_result(self, result: dict | None) -> None:
@@ -583,11 +716,9 @@ class ACCApp(App):
 
         if pane_id:
             self.registry.track_spawned(pane_id)
-            # Update recent dirs
-            wd = result["working_dir"]
-            if wd not in self.config.recent_dirs:
-                self.config.recent_dirs.insert(0, wd)
-                self.config.recent_dirs = self.config.recent_dirs[:10]
+            # Update recent dirs: move to front, dedupe (dicts keep insertion order)
+            recent = self.config.recent_dirs
+            recent[:] = list(dict.fromkeys([result["working_dir"], *recent]))[:10]
             # Force immediate poll
             self._poll()
         else:
@@ -602,6 +733,8 @@ class ACCApp(App):
             return
 
         if len(session.links) == 1:
+            import webbrowser
+
             webbrowser.open(session.links[0].url)
         else:
             self.push_screen(
@@ -611,6 +744,8 @@ class ACCApp(App):
 
     def _on_link_picked(self, url: str | None) -> None:
         if url:
+            import webbrowser
+
             webbrowser.open(url)
 
     def action_refresh(self) -> None:
@@ -633,13 +768,23 @@ class ACCApp(App):
 
 
 def _attach_to_tmux_pane(pane_id: str, session_name: str) -> None:
-    """Attach to a tmux pane after exiting the TUI."""
-    # Select the target pane first
-    subprocess.run(["tmux", "select-window", "-t", pane_id], check=False)
-    subprocess.run(["tmux", "select-pane", "-t", pane_id], check=False)
-
-    # If running inside tmux, switch client; otherwise attach
-    if os.environ.get("TMUX"):
-        subprocess.run(["tmux", "switch-client", "-t", session_name], check=False)
-    else:
-        subprocess.run(["tmux", "attach-session", "-t", session_name], check=False)
+    """Attach to a tmux pane while the TUI is suspended.
+
+    attach-session blocks until the user detaches (Ctrl-b d).
+    """
+    # Select the target pane, then switch client (inside tmux) or attach,
+    # all as one chained tmux invocation
+    switch = "switch-client" if os.environ.get("TMUX") else "attach-session"
+    result = subprocess.run(
+        [
+            "tmux",
+            "select-window", "-t", pane_id, ";",
+            "select-pane", "-t", pane_id, ";",
+            switch, "-t", session_name,
+        ],
+        check=False,
+    )
+    if result.returncode != 0:
+        # tmux stops a chain at the first failing command (e.g. the pane
+        # vanished); still get the user to the session
+        subprocess.run(["tmux", switch, "-t", session_name], check=False)
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from itertools import islice
 from dataclasses import dataclass
-from typing import Callable, TYPE_CHECKING
+from typing import Callable, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from acc.config import ACCConfig
@@ -24,22 +25,37 @@ class ColumnRegistry:
     """Registry of column plugins. Controls which columns appear and in what order."""
 
     def __init__(self) -> None:
-        self._columns: list[ColumnDef] = []
+        self._columns: dict[str, ColumnDef] = {}
 
     def register(self, column: ColumnDef) -> None:
         """Register a column plugin."""
-        # Replace if key already exists
-        self._columns = [c for c in self._columns if c.key != column.key]
-        self._columns.append(column)
+        # Replace if key already exists (moving it to the end)
+        self._columns.pop(column.key, None)
+        self._columns[column.key] = column
 
     def unregister(self, key: str) -> None:
         """Remove a column by key."""
-        self._columns = [c for c in self._columns if c.key != key]
+        self._columns.pop(key, None)
 
     @property
     def columns(self) -> list[ColumnDef]:
         """Get all registered columns in order."""
-        return list(self._columns)
+        return list(self._columns.values())
+
+    def extract_all(
+        self, sessions: Sequence[Session], indexes: Sequence[int] | None = None
+    ) -> dict[str, list[str]]:
+        """Extract every column for `sessions`, one column at a time.
+
+        Returns cell lists keyed by column key, in column order.
+        `indexes` gives each session's row index (defaults to its position).
+        """
+        if indexes is None:
+            indexes = range(len(sessions))
+        return {
+            key: [col.extract(s, i) for s, i in zip(sessions, indexes)]
+            for key, col in self._columns.items()
+        }
 
 
 # ── Built-in column extractors ──────────────────────────────────
@@ -57,52 +73,65 @@ def _extract_agent(session: Session, idx: int) -> str:
     return session.agent_name or "—"
 
 
-def _extract_goal(session: Session, idx: int) -> str:
-    return (session.goal or "—")[:60]
+def _make_truncated(attr: str, limit: int) -> Callable[[Session, int], str]:
+    """Build an extractor returning `session.<attr>` cut to `limit` chars."""
+
+    def extract(session: Session, idx: int) -> str:
+        value = getattr(session, attr)
+        return value[:limit] if value else "—"
 
+    return extract
 
-def _extract_progress(session: Session, idx: int) -> str:
-    return (session.progress or "—")[:40]
+
+_extract_goal = _make_truncated("goal", 60)
+_extract_progress = _make_truncated("progress", 40)
 
 
 def _extract_links(session: Session, idx: int) -> str:
-    if session.links:
-        return ", ".join(f"{ln.icon}{ln.label}" for ln in session.links[:3])
-    return "—"
+    links = session.links
+    if not links:
+        return "—"
+    # session.links is replaced (not mutated) on rescan, so identity is a
+    # safe cache key for the joined cell text
+    cached = session.links_cell
+    if cached is not None and cached[0] is links:
+        return cached[1]
+    text = ", ".join(f"{ln.icon}{ln.label}" for ln in islice(links, 3))
+    session.links_cell = (links, text)
+    return text
+
+
+_EXTRACTORS: dict[str, Callable[[Session, int], str]] = {
+    "#": _extract_index,
+    "status": _extract_status,
+    "agent": _extract_agent,
+    "goal": _extract_goal,
+    "progress": _extract_progress,
+    "links": _extract_links,
+}
+
+_DEFAULT_COLUMNS: list[dict] = [
+    {"key": "#", "header": "#", "width": 3},
+    {"key": "status", "header": "Status", "width": 12},
+    {"key": "agent", "header": "Agent", "width": 10},
+    {"key": "goal", "header": "Goal", "width": 0},
+    {"key": "progress", "header": "Progress", "width": 20},
+    {"key": "links", "header": "Links", "width": 0},
+]
 
 
 def create_default_registry(config: ACCConfig | None = None) -> ColumnRegistry:
     """Create a ColumnRegistry, potentially customized by config."""
     registry = ColumnRegistry()
 
-    # Map of all available extractors
-    extractors = {
-        "#": _extract_index,
-        "status": _extract_status,
-        "agent": _extract_agent,
-        "goal": _extract_goal,
-        "progress": _extract_progress,
-        "links": _extract_links,
-    }
-
-    # Default defaults if no config provided
-    defaults = [
-        {"key": "#", "header": "#", "width": 3},
-        {"key": "status", "header": "Status", "width": 12},
-        {"key": "agent", "header": "Agent", "width": 10},
-        {"key": "goal", "header": "Goal", "width": 0},
-        {"key": "progress", "header": "Progress", "width": 20},
-        {"key": "links", "header": "Links", "width": 0},
-    ]
-
     # Use config columns if available, otherwise defaults
-    column_configs = defaults
+    column_configs = _DEFAULT_COLUMNS
     if config and config.columns:
         column_configs = config.columns
 
     for col_cfg in column_configs:
         key = col_cfg.get("key")
-        if not key or key not in extractors:
+        if not key or key not in _EXTRACTORS:
             continue
 
         # Skip if explicitly hidden
@@ -114,7 +143,7 @@ def create_default_registry(config: ACCConfig | None = None) -> ColumnRegistry:
                 key=key,
                 header=col_cfg.get("header", key.capitalize()),
                 width=col_cfg.get("width", 0),
-                extract=extractors[key],
+                extract=_EXTRACTORS[key],
             )
         )
 
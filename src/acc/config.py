@@ -2,19 +2,75 @@
 
 from __future__ import annotations
 
+import copy
+import json
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 
-import yaml
-
 
 DEFAULT_CONFIG_PATH = Path.home() / ".acc" / "config.yaml"
 
+# (environment variable, ACCConfig attribute, type) applied on every load
+_ENV_OVERRIDES: tuple[tuple[str, str, type], ...] = (
+    ("CLAUDE_PATH", "claude_path", str),
+    ("ACC_TMUX_SESSION", "tmux_session", str),
+    ("ACC_REFRESH_INTERVAL", "refresh_interval", int),
+    ("ACC_SUMMARY_INTERVAL", "summary_interval", int),
+    ("ACC_MODEL", "summary_model", str),
+    ("ACC_LLM_API_KEY", "llm_api_key", str),
+    ("ACC_LLM_BASE_URL", "llm_base_url", str),
+    ("ACC_LLM_PROVIDER", "llm_provider", str),
+)
+
+# Parsed config keyed by (path, mtime_ns, size) so unchanged files aren't re-parsed
+_CONFIG_CACHE: dict[tuple[str, int, int], dict] = {}
+
+
+def _parse_config(path: Path, text: str) -> dict:
+    """Parse config file text: JSON for a `.json` file, else YAML."""
+    # json.loads reads the flat config mapping without importing PyYAML
+    if path.suffix.lower() == ".json":
+        return json.loads(text)
+
+    # Imported here so startup without a config file never loads PyYAML
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as Loader
+
+    return yaml.load(text, Loader=Loader) or {}
+
 
-@dataclass
+def _read_config_data(path: Path) -> dict:
+    """Return the parsed config for `path`, re-parsing only when the file changed."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}
+
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    data = _CONFIG_CACHE.get(key)
+    if data is None:
+        with open(path) as f:
+            data = _parse_config(path, f.read())
+        # Drop stale entries for this path before caching the new parse
+        for stale in [k for k in _CONFIG_CACHE if k[0] == key[0]]:
+            del _CONFIG_CACHE[stale]
+        _CONFIG_CACHE[key] = data
+    # Callers get their own copy; the app mutates lists like recent_dirs
+    return copy.deepcopy(data)
+
+
+@dataclass(frozen=True, slots=True)
 class ACCConfig:
-    """Application configuration."""
+    """Application configuration.
+
+    Frozen: fields can't be reassigned after `load`, though list fields
+    (e.g. `recent_dirs`) may still be updated in place.
+    """
 
     claude_path: str = "claude"
     tmux_session: str = "acc"
@@ -32,46 +88,22 @@ class ACCConfig:
 
     @classmethod
     def load(cls, config_path: Path | None = None) -> ACCConfig:
-        """Load config from YAML file, then overlay environment variables."""
+        """Load config from a YAML (or `.json`) file, then overlay environment variables."""
         path = config_path or DEFAULT_CONFIG_PATH
-        data: dict = {}
-
-        if path.exists():
-            with open(path) as f:
-                data = yaml.safe_load(f) or {}
-
-        config = cls(
-            claude_path=data.get("claude_path", cls.claude_path),
-            tmux_session=data.get("tmux_session", cls.tmux_session),
-            refresh_interval=data.get("refresh_interval", cls.refresh_interval),
-            summary_interval=data.get("summary_interval", cls.summary_interval),
-            summary_model=data.get("summary_model", cls.summary_model),
-            default_claude_args=data.get("default_claude_args", []),
-            recent_dirs=data.get("recent_dirs", []),
-            links=data.get("links", []),
-            agents=data.get("agents", []),
-            columns=data.get("columns", []),
-            llm_api_key=data.get("llm_api_key"),
-            llm_base_url=data.get("llm_base_url"),
-            llm_provider=data.get("llm_provider", "auto"),
-        )
+        data = _read_config_data(path)
+
+        # Collect everything first: the config is frozen once constructed.
+        # (With slots=True, cls.<field> is a slot descriptor, not the default,
+        # so missing keys are simply left out to get the field defaults.)
+        kwargs = {name: data[name] for name in _FIELD_NAMES if name in data}
 
         # Environment variables override config file values
-        if env_claude := os.environ.get("CLAUDE_PATH"):
-            config.claude_path = env_claude
-        if env_session := os.environ.get("ACC_TMUX_SESSION"):
-            config.tmux_session = env_session
-        if env_refresh := os.environ.get("ACC_REFRESH_INTERVAL"):
-            config.refresh_interval = int(env_refresh)
-        if env_summary := os.environ.get("ACC_SUMMARY_INTERVAL"):
-            config.summary_interval = int(env_summary)
-        if env_model := os.environ.get("ACC_MODEL"):
-            config.summary_model = env_model
-        if env_key := os.environ.get("ACC_LLM_API_KEY"):
-            config.llm_api_key = env_key
-        if env_url := os.environ.get("ACC_LLM_BASE_URL"):
-            config.llm_base_url = env_url
-        if env_provider := os.environ.get("ACC_LLM_PROVIDER"):
-            config.llm_provider = env_provider
-
-        return config
+        env = os.environ
+        for env_var, attr, cast in _ENV_OVERRIDES:
+            if value := env.get(env_var):
+                kwargs[attr] = cast(value)
+
+        return cls(**kwargs)
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(ACCConfig))
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import re
+import secrets
 import subprocess
+import sys
 import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 
 import logging
@@ -11,9 +16,11 @@ import psutil
 
 logger = logging.getLogger("acc.discovery")
 
+from acc import procfs
 from acc.agents import AgentDetector, AgentRegistry
 from acc.links import DetectedLink
 from acc.status import SessionStatus
+from acc.tmux_client import CONTROL_SESSION, control
 
 
 @dataclass
@@ -31,25 +38,56 @@ class Session:
     agent_name: str = ""  # e.g. "Claude", "OpenCode", "Codex"
     detector: AgentDetector | None = None
     status: SessionStatus = SessionStatus.WORKING
+    # Cached classify_content() result and the (content hash, detector) it's for
+    content_status: SessionStatus | None = None
+    content_status_key: tuple[int, AgentDetector | None] | None = None
     exit_code: int | None = None
     goal: str = ""
     progress: str = ""
     links: list[DetectedLink] = field(default_factory=list)
+    links_cell: tuple[list[DetectedLink], str] | None = field(default=None, repr=False)
     last_output_time: float = field(default_factory=time.time)
     last_content_hash: int = 0
+    last_status_check: float = 0.0
     needs_attention_notified: bool = False
     needs_attention_notified: bool = False
     spawned_by_ccc: bool = False
     content_preview: str = ""
+    # tmux (window_activity, history_size, width, height) from the latest
+    # list-panes, and the same values and time for `last_capture`
+    activity: tuple[int, ...] | None = None
+    captured_activity: tuple[int, ...] | None = None
+    captured_at: float = 0.0
+    last_capture: str = field(default="", repr=False)
 
     @property
     def display_name(self) -> str:
         prefix = f"[{self.agent_name}] " if self.agent_name else ""
         return prefix + (self.goal or f"Session {self.pane_id}")
 
+    def capture_is_current(self) -> bool:
+        """Whether `last_capture` still shows what the pane shows.
+
+        tmux stamps window activity in whole seconds, so output later in
+        the second a capture was taken in wouldn't move the stamp; the
+        capture only counts as current if it started after that second.
+        """
+        return (
+            self.activity is not None
+            and self.activity == self.captured_activity
+            and int(self.captured_at) > self.activity[0]
+        )
+
 
 def _run_tmux(*args: str) -> str:
-    """Run a tmux command and return stdout."""
+    """Run a tmux command and return stdout.
+
+    Goes through the shared control-mode client when it can, and spawns
+    `tmux` otherwise.
+    """
+    output = control.run(*args)
+    if output is not None:
+        return output.strip()
     try:
         result = subprocess.run(
             ["tmux", *args],
@@ -62,33 +100,128 @@ def _run_tmux(*args: str) -> str:
         return ""
 
 
+async def _run_tmux_async(*args: str) -> str:
+    """Async variant of `_run_tmux`; the fallback is an asyncio subprocess."""
+    output = await control.run_async(*args)
+    if output is not None:
+        return output.strip()
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "tmux", *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        return ""
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
+    except asyncio.TimeoutError:
+        proc.kill()
+        return ""
+    return stdout.decode(errors="replace").strip()
+
+
+# pid -> (identity, registry, detector) from earlier discovery cycles. The
+# identity is (start time, name), so a reused pid or an exec into another
+# program misses the cache; detector is None for non-agent processes.
+_agent_matches: dict[int, tuple[tuple, AgentRegistry, AgentDetector | None]] = {}
+_agent_matches_used: set[int] = set()
+
+
 def _find_agent_in_tree(
-    pid: int, agent_registry: AgentRegistry
+    pid: int,
+    agent_registry: AgentRegistry,
+    procs: dict[int, tuple[str, int, int]] | None = None,
+    children: dict[int, list[int]] | None = None,
 ) -> tuple[bool, AgentDetector | None]:
     """Walk the process tree under `pid` to check for any known agent process.
 
+    `procs`/`children` are a `procfs.scan_processes` snapshot and its
+    `procfs.children_of` map; without them the tree comes from psutil.
     Returns (agent_found, matching_detector).
     """
-    all_names = agent_registry.all_process_names()
-    try:
-        parent = psutil.Process(pid)
-        for proc in [parent] + parent.children(recursive=True):
-            try:
-                name = proc.name().lower()
-                cmdline = " ".join(proc.cmdline()).lower()
-                for agent_name in all_names:
-                    if agent_name.lower() in name or agent_name.lower() in cmdline:
-                        detector = agent_registry.find_detector(agent_name)
-                        return True, detector
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-    except (psutil.NoSuchProcess, psutil.AccessDenied):
-        pass
+    if procs is not None and children is not None:
+        if pid not in procs:
+            return False, None
+        pids = [pid]
+        for tree_pid in pids:  # breadth-first; appending while iterating
+            pids.extend(children.get(tree_pid, ()))
+    else:
+        try:
+            parent = psutil.Process(pid)
+            pids = [pid] + [child.pid for child in parent.children(recursive=True)]
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return False, None
+
+    for child_pid in pids:
+        stat = procs.get(child_pid) if procs is not None else None
+        detector = _match_process(child_pid, agent_registry, stat)
+        # An agent that exited lingers as a zombie until its parent reaps
+        # it; only matches get the extra liveness read
+        if detector is not None and _is_process_alive(child_pid):
+            return True, detector
     return False, None
 
 
+def _match_process(
+    pid: int,
+    agent_registry: AgentRegistry,
+    stat: tuple[str, int, int] | None = None,
+) -> AgentDetector | None:
+    """The detector for the agent process `pid`, or None if it isn't one.
+
+    `stat` is the process's already-parsed /proc stat, if at hand.
+    Results are memoised per process identity, so a long-lived process
+    only has its command line read and matched once.
+    """
+    cmdline: str | None
+    if procfs.AVAILABLE:
+        if stat is None:
+            data = procfs.read_stat(pid)
+            if not data:
+                return None
+            stat = procfs.parse_stat(data)
+        comm, _, start = stat
+        identity: tuple = (start, comm)
+    else:
+        try:
+            proc = psutil.Process(pid)
+            identity = (proc.create_time(), proc.name())
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+
+    _agent_matches_used.add(pid)
+    cached = _agent_matches.get(pid)
+    if cached is not None and cached[0] == identity and cached[1] is agent_registry:
+        return cached[2]
+
+    if procfs.AVAILABLE:
+        cmdline = procfs.read_cmdline(pid)
+    else:
+        try:
+            cmdline = " ".join(proc.cmdline())
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            cmdline = None
+    if cmdline is None:
+        return None
+
+    detector = agent_registry.match_process(identity[1], cmdline)
+    _agent_matches[pid] = (identity, agent_registry, detector)
+    return detector
+
+
+def _prune_agent_matches() -> None:
+    """Forget memoised processes that weren't looked up since the last prune."""
+    for pid in list(_agent_matches):
+        if pid not in _agent_matches_used:
+            _agent_matches.pop(pid, None)
+    _agent_matches_used.clear()
+
+
 def _is_process_alive(pid: int) -> bool:
     """Check if a process is still running."""
+    if procfs.AVAILABLE:
+        return procfs.is_alive(pid)
     try:
         proc = psutil.Process(pid)
         return proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE
@@ -96,52 +229,44 @@ def _is_process_alive(pid: int) -> bool:
         return False
 
 
-def _get_exit_code(pid: int) -> int | None:
-    """Try to get exit code of a finished process. Returns None if still running."""
-    try:
-        proc = psutil.Process(pid)
-        if proc.status() == psutil.STATUS_ZOMBIE:
-            return proc.wait(timeout=0)
-    except (psutil.NoSuchProcess, psutil.AccessDenied):
-        pass
-    return None
+# One list-panes line: "session_name:window_index.pane_index pane_pid"
+# plus the `Session.activity` fields. tmux doesn't allow ":" or "." in
+# session names, but spaces are fine.
+_PANE_FORMAT = (
+    "#{session_name}:#{window_index}.#{pane_index} #{pane_pid}"
+    " #{window_activity} #{history_size} #{pane_width} #{pane_height}"
+)
+_PANE_LINE_RE = re.compile(r"(([^:]+):(\d+)\.(\d+)) (\d+)((?: \d+){4})?")
 
 
 def discover_panes(agent_registry: AgentRegistry) -> list[Session]:
     """Discover all tmux panes and check which ones are running a coding agent."""
-    output = _run_tmux(
-        "list-panes", "-a",
-        "-F", "#{session_name}:#{window_index}.#{pane_index} #{pane_pid}",
-    )
+    output = _run_tmux("list-panes", "-a", "-F", _PANE_FORMAT)
     if not output:
         logger.debug("No output from tmux list-panes")
         return []
 
     logger.debug("tmux list-panes output:\n%s", output)
+    # One pass over /proc serves every pane's tree walk
+    procs = procfs.scan_processes() if procfs.AVAILABLE else None
+    children = procfs.children_of(procs) if procs is not None else None
     sessions: list[Session] = []
     for line in output.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        parts = line.split(" ", 1)
-        if len(parts) != 2:
-            continue
-        pane_id = parts[0]
-        try:
-            pane_pid = int(parts[1])
-        except ValueError:
-            continue
-
-        # Parse pane_id: "session_name:window_index.pane_index"
-        try:
-            session_part, pane_part = pane_id.rsplit(".", 1)
-            session_name, window_str = session_part.split(":", 1)
-            window_index = int(window_str)
-            pane_index = int(pane_part)
-        except (ValueError, IndexError):
+        match = _PANE_LINE_RE.fullmatch(line.strip())
+        if match is None:
             continue
-
-        agent_running, detector = _find_agent_in_tree(pane_pid, agent_registry)
+        pane_id, session_name, window_str, pane_str, pid_str, activity = match.groups()
+        if session_name == CONTROL_SESSION:
+            continue  # acc's own control-mode client
+        # Interned, so the many pane_id-keyed dicts (registry, captures,
+        # summaries, table rows) compare keys by identity poll after poll
+        pane_id = sys.intern(pane_id)
+        session_name = sys.intern(session_name)
+        window_index = int(window_str)
+        pane_index = int(pane_str)
+        pane_pid = int(pid_str)
+
+        agent_running, detector = _find_agent_in_tree(pane_pid, agent_registry, procs, children)
 
         session = Session(
             pane_id=pane_id,
@@ -152,19 +277,135 @@ def discover_panes(agent_registry: AgentRegistry) -> list[Session]:
             agent_running=agent_running,
             agent_name=detector.name if detector else "",
             detector=detector,
+            activity=tuple(map(int, activity.split())) if activity else None,
         )
         sessions.append(session)
         logger.debug("Discovered session: %s (agent=%s)", pane_id, agent_running)
 
+    _prune_agent_matches()
+    if procfs.AVAILABLE:
+        procfs.release_unused()
     return sessions
 
 
 def capture_pane(pane_id: str, lines: int = 50) -> str:
     """Capture the last N lines of a tmux pane."""
-    return _run_tmux(
-        "capture-pane", "-t", pane_id, "-p",
-        "-S", str(-lines),
+    return _run_tmux(*_capture_args(pane_id, lines))
+
+
+async def capture_pane_async(pane_id: str, lines: int = 50) -> str:
+    """Capture the last N lines of a tmux pane without blocking the event loop."""
+    return await _run_tmux_async(*_capture_args(pane_id, lines))
+
+
+def _capture_args(pane_id: str, lines: int) -> list[str]:
+    return ["capture-pane", "-t", pane_id, "-p", "-S", str(-lines)]
+
+
+# Per-process random marker, so pane output can't forge a split point
+# (e.g. a pane showing acc's own debug log or another acc instance)
+_BULK_SEP = f"ACC_SEP_{secrets.token_hex(8)}:"
+
+# Panes per batched tmux call; larger sets are split and run concurrently.
+_BULK_CHUNK = 16
+
+
+def _bulk_capture_args(pane_ids: list[str], lines: int) -> list[str]:
+    """Chain capture-pane + marker display-message commands for each pane."""
+    args: list[str] = []
+    for pane_id in pane_ids:
+        if args:
+            args.append(";")
+        args += _capture_args(pane_id, lines)
+        args += [";", "display-message", "-p", _BULK_SEP + pane_id.replace("#", "##")]
+    return args
+
+
+def _split_bulk_output(output: str, pane_ids: list[str]) -> dict[str, str]:
+    """Split batched capture output on the per-pane markers."""
+    results: dict[str, str] = {}
+    chunk: list[str] = []
+    expected = iter(pane_ids)
+    pane_id = next(expected)
+    for line in output.splitlines():
+        if line == _BULK_SEP + pane_id:
+            results[pane_id] = "\n".join(chunk).strip()
+            chunk = []
+            pane_id = next(expected, None)
+            if pane_id is None:
+                break
+        else:
+            chunk.append(line)
+    return results
+
+
+def capture_panes_bulk(pane_ids: list[str], lines: int = 200) -> dict[str, str]:
+    """Capture the last N lines of several tmux panes with a single tmux call.
+
+    Over the control-mode client every capture is pipelined as its own
+    command. Otherwise one `tmux` call chains them, each pane's capture
+    followed by a `display-message` marker so the combined stdout can be
+    split back into per-pane content. tmux aborts a command sequence at
+    the first failure, so panes that get no marker (e.g. one vanished
+    mid-poll) are captured individually instead.
+    """
+    if not pane_ids:
+        return {}
+
+    futures = [(pane_id, control.submit(*_capture_args(pane_id, lines))) for pane_id in pane_ids]
+    results: dict[str, str] = {}
+    for pane_id, future in futures:
+        try:
+            outcome = future.result(5) if future is not None else None
+        except FutureTimeoutError:
+            outcome = None
+        if outcome is not None:
+            ok, content = outcome
+            results[pane_id] = content.strip() if ok else ""
+    missing = [pane_id for pane_id in pane_ids if pane_id not in results]
+    if not missing:
+        return results
+
+    results.update(_split_bulk_output(_run_tmux(*_bulk_capture_args(missing, lines)), missing))
+    for pane_id in missing:
+        if pane_id not in results:
+            results[pane_id] = capture_pane(pane_id, lines=lines)
+    return {pane_id: results[pane_id] for pane_id in pane_ids}
+
+
+async def capture_panes_bulk_async(pane_ids: list[str], lines: int = 200) -> dict[str, str]:
+    """Async variant of `capture_panes_bulk`.
+
+    Without control mode, pane ids are batched `_BULK_CHUNK` at a time and
+    the batches (plus any single-pane fallbacks) run concurrently via
+    `asyncio.gather`.
+    """
+    if not pane_ids:
+        return {}
+
+    contents = await asyncio.gather(
+        *(control.run_async(*_capture_args(pane_id, lines)) for pane_id in pane_ids)
     )
+    results = {
+        pane_id: content.strip()
+        for pane_id, content in zip(pane_ids, contents)
+        if content is not None
+    }
+    pending = [pane_id for pane_id in pane_ids if pane_id not in results]
+    chunks = [pending[i:i + _BULK_CHUNK] for i in range(0, len(pending), _BULK_CHUNK)]
+    outputs = await asyncio.gather(
+        *(_run_tmux_async(*_bulk_capture_args(chunk, lines)) for chunk in chunks)
+    )
+    for chunk, output in zip(chunks, outputs):
+        results.update(_split_bulk_output(output, chunk))
+
+    missing = [pane_id for pane_id in pending if pane_id not in results]
+    if missing:
+        contents = await asyncio.gather(
+            *(capture_pane_async(pane_id, lines) for pane_id in missing)
+        )
+        results.update(zip(missing, contents))
+    return {pane_id: results[pane_id] for pane_id in pane_ids}
 
 
 class SessionRegistry:
@@ -185,40 +426,32 @@ class SessionRegistry:
         Returns the updated session dict.
         Only tracks panes that are running an agent or were spawned by ccc.
         """
-        current_pane_ids = {s.pane_id for s in discovered}
+        spawned = self._spawned_pane_ids
 
         # Remove sessions whose panes no longer exist
-        to_remove = []
-        for pane_id in self.sessions:
-            if (
-                pane_id not in current_pane_ids
-                and pane_id not in self._spawned_pane_ids
-            ):
-                to_remove.append(pane_id)
-        for pane_id in to_remove:
+        for pane_id in self.sessions.keys() - {s.pane_id for s in discovered} - spawned:
             del self.sessions[pane_id]
+        # Panes not refreshed below (e.g. a spawned pane that went away)
+        # must not keep reusing their last capture
+        for session in self.sessions.values():
+            session.activity = None
 
         # Update or add sessions
         for new_session in discovered:
-            should_track = (
-                new_session.agent_running
-                or new_session.pane_id in self._spawned_pane_ids
-            )
-            if not should_track:
+            pane_id = new_session.pane_id
+            if not (new_session.agent_running or pane_id in spawned):
                 continue
 
-            if new_session.pane_id in self.sessions:
-                existing = self.sessions[new_session.pane_id]
+            existing = self.sessions.get(pane_id)
+            if existing is not None:
                 existing.agent_running = new_session.agent_running
                 existing.pane_pid = new_session.pane_pid
                 existing.agent_name = new_session.agent_name or existing.agent_name
                 existing.detector = new_session.detector or existing.detector
+                existing.activity = new_session.activity
             else:
-                if new_session.pane_id in self._spawned_pane_ids:
-                    new_session.spawned_by_ccc = True
-                if new_session.pane_id in self._spawned_pane_ids:
-                    new_session.spawned_by_ccc = True
-                self.sessions[new_session.pane_id] = new_session
-                logger.debug("Added new session: %s", new_session.pane_id)
+                new_session.spawned_by_ccc = pane_id in spawned
+                self.sessions[pane_id] = new_session
+                logger.debug("Added new session: %s", pane_id)
 
         return self.sessions
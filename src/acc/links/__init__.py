@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from typing import Iterator
+
 from acc.links.base import DetectedLink, LinkPlugin
 from acc.links.github import GitHubIssuePlugin, GitHubPRPlugin, GitHubRepoPlugin
 from acc.links.linear import LinearPlugin
@@ -10,9 +13,27 @@ from acc.links.generic import GenericURLPlugin
 from acc.links.custom import load_custom_plugins
 
 
+def _dedup_key(url: str) -> str:
+    """Key under which two links count as the same URL.
+
+    Drops trailing slashes and lowercases the scheme and host, which are
+    case-insensitive; the path is left alone. Non-URL links (ticket ids)
+    only lose trailing slashes.
+    """
+    url = url.rstrip("/")
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        return url
+    host, slash, path = rest.partition("/")
+    return f"{scheme.lower()}://{host.lower()}{slash}{path}"
+
+
 class LinkRegistry:
     """Aggregates all built-in and custom link plugins."""
 
+    # Bound for scan_cached's content-hash → links LRU
+    SCAN_CACHE_SIZE = 256
+
     def __init__(self, custom_link_configs: list[dict] | None = None) -> None:
         self.plugins: list[LinkPlugin] = [
             GitHubPRPlugin(),
@@ -26,19 +47,47 @@ class LinkRegistry:
             self.plugins.extend(load_custom_plugins(custom_link_configs))
         # Generic URL catch-all must be last
         self.plugins.append(GenericURLPlugin())
+        self._scan_cache: OrderedDict[int, list[DetectedLink]] = OrderedDict()
 
     def scan(self, text: str) -> list[DetectedLink]:
         """Scan text for all matching links across all plugins."""
-        results: list[DetectedLink] = []
+        return list(self.iter_scan(text))
+
+    def iter_scan(self, text: str) -> Iterator[DetectedLink]:
+        """Yield deduplicated links in plugin priority order as they're found.
+
+        Each plugin scans the whole text on its own pass: URLs nest (a
+        GitHub link inside a localhost redirect, ticket ids inside URLs),
+        so one left-to-right alternation would let an outer match swallow
+        the inner ones. Passes run lazily, so callers that stop early
+        (first link, "any link?") skip the later plugins; plugins whose
+        required literal is absent skip their regex entirely.
+        """
         seen_urls: set[str] = set()
         for plugin in self.plugins:
             for link in plugin.find_links(text):
-                # Normalize URL to avoid duplicates (e.g. trailing slash)
-                normalized = link.url.rstrip("/")
-                if normalized not in seen_urls:
-                    seen_urls.add(normalized)
-                    results.append(link)
-        return results
+                key = _dedup_key(link.url)
+                if key not in seen_urls:
+                    seen_urls.add(key)
+                    yield link
+
+    def scan_cached(self, content_hash: int, text: str) -> list[DetectedLink]:
+        """Like `scan`, but reuse the result for content already seen.
+
+        `content_hash` is the hash the poll loop has already computed for
+        `text`; repeated tails (shared banners, content flapping back) skip
+        the regex pass entirely.
+        """
+        cached = self._scan_cache.get(content_hash)
+        if cached is not None:
+            self._scan_cache.move_to_end(content_hash)
+            return list(cached)
+
+        results = self.scan(text)
+        self._scan_cache[content_hash] = results
+        if len(self._scan_cache) > self.SCAN_CACHE_SIZE:
+            self._scan_cache.popitem(last=False)
+        return list(results)
 
 
 __all__ = [
@@ -7,9 +7,12 @@ from dataclasses import dataclass
 from typing import Callable
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectedLink:
-    """A link found in pane output."""
+    """A link found in pane output.
+
+    Slotted: one is built per match on every rescan.
+    """
 
     plugin_name: str
     icon: str
@@ -24,18 +27,25 @@ class LinkPlugin:
         self,
         name: str,
         icon: str,
-        pattern: str,
+        pattern: str | re.Pattern,
         label_fn: Callable[[re.Match], str] | None = None,
         label: str | None = None,
+        required_substring: str | None = None,
     ) -> None:
         self.name = name
         self.icon = icon
-        self._pattern = re.compile(pattern)
+        # Built-ins pass module-level compiled patterns; custom plugins pass strings
+        self._pattern = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern)
         self._label_fn = label_fn
         self._static_label = label
+        # Literal every match must contain; text without it can't match, so
+        # find_links skips the regex after a plain `in` check
+        self.required_substring = required_substring
 
     def find_links(self, text: str) -> list[DetectedLink]:
         """Find all matching links in the given text."""
+        if self.required_substring and self.required_substring not in text:
+            return []
         results: list[DetectedLink] = []
         seen: set[str] = set()
         for match in self._pattern.finditer(text):
@@ -43,18 +53,22 @@ class LinkPlugin:
             if url in seen:
                 continue
             seen.add(url)
-
-            if self._label_fn:
-                label = self._label_fn(match)
-            elif self._static_label:
-                label = self._static_label
-            else:
-                label = url
-
-            results.append(DetectedLink(
-                plugin_name=self.name,
-                icon=self.icon,
-                url=url,
-                label=label,
-            ))
+            results.append(self.make_link(match))
         return results
+
+    def make_link(self, match: re.Match) -> DetectedLink:
+        """Build the DetectedLink for a match of this plugin's pattern."""
+        url = match.group(0)
+        if self._label_fn:
+            label = self._label_fn(match)
+        elif self._static_label:
+            label = self._static_label
+        else:
+            label = url
+
+        return DetectedLink(
+            plugin_name=self.name,
+            icon=self.icon,
+            url=url,
+            label=label,
+        )
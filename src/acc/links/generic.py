@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from acc.links.base import LinkPlugin
 
+_URL_RE = re.compile(r"https?://[^\s\"')\]>|│]+")
+
 
 class GenericURLPlugin(LinkPlugin):
     """Catch-all detector for any http/https URL."""
@@ -15,25 +18,31 @@ class GenericURLPlugin(LinkPlugin):
         super().__init__(
             name="url",
             icon="🌐",
-            pattern=r"https?://[^\s\"')\]>|│]+",
+            pattern=_URL_RE,
             label_fn=self._label,
+            required_substring="http",
         )
 
     @staticmethod
     def _label(match: re.Match) -> str:
-        url = match.group(0).rstrip(".,;:!?")
-        try:
-            parsed = urlparse(url)
-            host = parsed.hostname or url
-            # Strip www. prefix
-            if host.startswith("www."):
-                host = host[4:]
-            path = parsed.path.rstrip("/")
-            if path and path != "/":
-                # Show host + first meaningful path segment
-                parts = [p for p in path.split("/") if p]
-                if parts:
-                    return f"{host}/{'…' if len(parts) > 1 else ''}{parts[-1]}"
-            return host
-        except Exception:
-            return url
+        return _url_label(match.group(0).rstrip(".,;:!?"))
+
+
+@lru_cache(maxsize=256)
+def _url_label(url: str) -> str:
+    """Short host/path label for a URL (URLs repeat poll after poll)."""
+    try:
+        parsed = urlparse(url)
+        host = parsed.hostname or url
+        # Strip www. prefix
+        if host.startswith("www."):
+            host = host[4:]
+        path = parsed.path.rstrip("/")
+        if path and path != "/":
+            # Show host + first meaningful path segment
+            parts = [p for p in path.split("/") if p]
+            if parts:
+                return f"{host}/{'…' if len(parts) > 1 else ''}{parts[-1]}"
+        return host
+    except Exception:
+        return url
@@ -1,11 +1,16 @@
-"""GitHub link plugins — PR and Issue detection."""
+"""GitHub link plugins — PR, Issue and repo detection."""
 
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 from acc.links.base import LinkPlugin
 
+_PR_RE = re.compile(r"https://github\.com/[^\s]+/pull/(\d+)")
+_ISSUE_RE = re.compile(r"https://github\.com/[^\s]+/issues/(\d+)")
+_REPO_RE = re.compile(r"https://github\.com/[^\s\"')\]>]+")
+
 
 class GitHubPRPlugin(LinkPlugin):
     """Detect GitHub pull request URLs."""
@@ -14,8 +19,9 @@ class GitHubPRPlugin(LinkPlugin):
         super().__init__(
             name="github-pr",
             icon="🔗",
-            pattern=r"https://github\.com/[^\s]+/pull/(\d+)",
+            pattern=_PR_RE,
             label_fn=self._label,
+            required_substring="https://github.com/",
         )
 
     @staticmethod
@@ -30,8 +36,9 @@ class GitHubIssuePlugin(LinkPlugin):
         super().__init__(
             name="github-issue",
             icon="🔗",
-            pattern=r"https://github\.com/[^\s]+/issues/(\d+)",
+            pattern=_ISSUE_RE,
             label_fn=self._label,
+            required_substring="https://github.com/",
         )
 
     @staticmethod
@@ -46,19 +53,23 @@ class GitHubRepoPlugin(LinkPlugin):
         super().__init__(
             name="github",
             icon="🔗",
-            pattern=r"https://github\.com/[^\s\"')\]>]+",
+            pattern=_REPO_RE,
             label_fn=self._label,
+            required_substring="https://github.com/",
         )
 
     @staticmethod
     def _label(match: re.Match) -> str:
-        url = match.group(0)
-        # Extract meaningful path: github.com/owner/repo/...
-        path = url.replace("https://github.com/", "").rstrip("/")
-        if path:
-            parts = path.split("/")
-            if len(parts) >= 2:
-                return f"{parts[0]}/{parts[1]}"
-            return parts[0]
-        return "GitHub"
-
+        return _repo_label(match.group(0))
+
+
+@lru_cache(maxsize=256)
+def _repo_label(url: str) -> str:
+    # Extract meaningful path: github.com/owner/repo/...
+    path = url.replace("https://github.com/", "").rstrip("/")
+    if path:
+        parts = path.split("/")
+        if len(parts) >= 2:
+            return f"{parts[0]}/{parts[1]}"
+        return parts[0]
+    return "GitHub"
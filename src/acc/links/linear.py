@@ -6,6 +6,8 @@ import re
 
 from acc.links.base import LinkPlugin
 
+_TICKET_RE = re.compile(r"\b([A-Z]+-\d+)\b")
+
 
 class LinearPlugin(LinkPlugin):
     """Detect Linear-style ticket identifiers (e.g. ENG-123)."""
@@ -14,10 +16,8 @@ class LinearPlugin(LinkPlugin):
         super().__init__(
             name="linear",
             icon="🎫",
-            pattern=r"\b([A-Z]+-\d+)\b",
-            label_fn=self._label,
+            pattern=_TICKET_RE,
+            # No label_fn: the ticket id is the whole match, which
+            # make_link already uses as the label
+            required_substring="-",
         )
-
-    @staticmethod
-    def _label(match: re.Match) -> str:
-        return match.group(1)
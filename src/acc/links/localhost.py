@@ -6,6 +6,8 @@ import re
 
 from acc.links.base import LinkPlugin
 
+_LOCALHOST_RE = re.compile(r"https?://localhost:\d+[^\s\"']*")
+
 
 class LocalhostPlugin(LinkPlugin):
     """Detect localhost URLs with port numbers (e.g. http://localhost:5173)."""
@@ -14,8 +16,9 @@ class LocalhostPlugin(LinkPlugin):
         super().__init__(
             name="localhost",
             icon="🌐",
-            pattern=r"https?://localhost:\d+[^\s\"']*",
+            pattern=_LOCALHOST_RE,
             label_fn=self._label,
+            required_substring="://localhost:",
         )
 
     @staticmethod
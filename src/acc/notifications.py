@@ -18,12 +18,21 @@ _NOTIFY_TRANSITIONS: set[tuple[SessionStatus, SessionStatus]] = {
     (SessionStatus.IDLE, SessionStatus.NEEDS_ATTENTION),
 }
 
+# The same transitions as one bitmask: bit `prev.code << _CODE_BITS | curr.code`
+# is set for each, so the check is a shift and a mask (8 statuses max)
+_CODE_BITS = 3
+_NOTIFY_MASK = 0
+for _prev, _curr in _NOTIFY_TRANSITIONS:
+    _NOTIFY_MASK |= 1 << (_prev.code << _CODE_BITS | _curr.code)
+del _prev, _curr
+
 
 class NotificationManager:
     """Tracks session state transitions and fires notifications."""
 
     def __init__(self) -> None:
-        self._previous_states: dict[str, SessionStatus] = {}
+        # pane_id -> SessionStatus.code seen on the previous check
+        self._previous_states: dict[str, int] = {}
         self._attention_panes: set[str] = set()
 
     @property
@@ -49,7 +58,7 @@ class NotificationManager:
             prev = self._previous_states.get(pane_id)
             curr = session.status
 
-            if prev is not None and (prev, curr) in _NOTIFY_TRANSITIONS:
+            if prev is not None and _NOTIFY_MASK >> (prev << _CODE_BITS | curr.code) & 1:
                 if not session.needs_attention_notified:
                     newly_alerting.append(pane_id)
                     self._attention_panes.add(pane_id)
@@ -60,12 +69,10 @@ class NotificationManager:
                 self._attention_panes.discard(pane_id)
                 session.needs_attention_notified = False
 
-            self._previous_states[pane_id] = curr
+            self._previous_states[pane_id] = curr.code
 
         # Clean up stale entries
-        active_ids = set(sessions.keys())
-        stale = set(self._previous_states.keys()) - active_ids
-        for pane_id in stale:
+        for pane_id in self._previous_states.keys() - sessions.keys():
             del self._previous_states[pane_id]
             self._attention_panes.discard(pane_id)
 
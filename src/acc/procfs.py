@@ -0,0 +1,140 @@
+"""Direct /proc readers for process discovery on Linux.
+
+Discovery needs the process tree under each pane plus each process's
+command name and command line. psutil rebuilds the whole pid -> ppid map
+for every `children(recursive=True)` call and opens, reads and closes
+several /proc files per process, so on Linux one pass over /proc is
+shared by all panes and the files are read here directly. Other
+platforms keep using psutil.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from collections import defaultdict
+
+AVAILABLE = sys.platform.startswith("linux") and os.path.isdir("/proc")
+
+# /proc/<pid>/stat fds kept open across discovery cycles, so re-reading a
+# long-lived process is a single pread. An fd stays bound to its process:
+# once that exits, reads fail (ESRCH) even if the pid is reused. Every
+# process's stat is read each cycle, so up to a quarter of the fd limit
+# (256-4096) is kept open.
+_MAX_STAT_FDS = 256
+if AVAILABLE:
+    import resource
+
+    _soft_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+    _MAX_STAT_FDS = min(max(_soft_limit // 4, _MAX_STAT_FDS), 4096)
+
+_stat_fds: dict[int, int] = {}
+_stat_used: set[int] = set()
+_stat_lock = threading.Lock()
+
+
+def _read(path: str) -> bytes | None:
+    """Read a whole /proc file, or None if the process is gone."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def read_stat(pid: int) -> bytes | None:
+    """Read `/proc/<pid>/stat` through a kept-open fd, or None if it's gone."""
+    with _stat_lock:
+        fd = _stat_fds.pop(pid, None)
+        if fd is not None:
+            try:
+                data = os.pread(fd, 4096, 0)
+            except OSError:
+                # The process behind this fd exited; the pid may be reused
+                os.close(fd)
+            else:
+                _stat_fds[pid] = fd
+                _stat_used.add(pid)
+                return data
+        if len(_stat_fds) >= _MAX_STAT_FDS:
+            return _read(f"/proc/{pid}/stat")
+        try:
+            fd = os.open(f"/proc/{pid}/stat", os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            data = os.pread(fd, 4096, 0)
+        except OSError:
+            os.close(fd)
+            return None
+        _stat_fds[pid] = fd
+        _stat_used.add(pid)
+        return data
+
+
+def release_unused() -> None:
+    """Close the kept stat fds that weren't read since the previous call."""
+    with _stat_lock:
+        for pid in [pid for pid in _stat_fds if pid not in _stat_used]:
+            os.close(_stat_fds.pop(pid))
+        _stat_used.clear()
+
+
+def is_alive(pid: int) -> bool:
+    """Whether `pid` exists and isn't a zombie, from its stat state field."""
+    stat = read_stat(pid)
+    if not stat:
+        return False
+    return stat[stat.rfind(b")") + 2:][:1] not in (b"Z", b"X", b"x")
+
+
+def parse_stat(data: bytes) -> tuple[str, int, int]:
+    """Parse `/proc/<pid>/stat` into (comm, ppid, starttime).
+
+    comm is parenthesised and may itself contain spaces and parentheses,
+    so the fixed fields are read after the *last* ")".
+    """
+    rpar = data.rfind(b")")
+    comm = data[data.find(b"(") + 1:rpar].decode(errors="replace")
+    fields = data[rpar + 2:].split()
+    return comm, int(fields[1]), int(fields[19])
+
+
+def read_cmdline(pid: int) -> str | None:
+    """Command line of `pid` joined with spaces, or None if it's gone.
+
+    Matches `" ".join(psutil.Process(pid).cmdline())`.
+    """
+    data = _read(f"/proc/{pid}/cmdline")
+    if data is None:
+        return None
+    return data.rstrip(b"\0").replace(b"\0", b" ").decode(errors="replace")
+
+
+def scan_processes() -> dict[int, tuple[str, int, int]]:
+    """(comm, ppid, starttime) for every process, from one pass over /proc."""
+    procs: dict[int, tuple[str, int, int]] = {}
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if entry.name.isdigit():
+                pid = int(entry.name)
+                if stat := read_stat(pid):
+                    procs[pid] = parse_stat(stat)
+    return procs
+
+
+def children_of(procs: dict[int, tuple[str, int, int]]) -> dict[int, list[int]]:
+    """Map each pid in a `scan_processes` result to its child pids."""
+    children: defaultdict[int, list[int]] = defaultdict(list)
+    for pid, (_, ppid, _) in procs.items():
+        children[ppid].append(pid)
+    return children
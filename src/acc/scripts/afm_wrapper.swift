@@ -3,28 +3,69 @@
 import Foundation
 import FoundationModels
 
+@available(macOS 26.0, *)
+func respond(to prompt: String) async throws -> String {
+    // Initialize the model configuration
+    let config = LanguageModelConfiguration()
+    
+    // Create a session
+    let session = try await LanguageModelSession(configuration: config)
+    
+    // Generate text
+    let stream = try await session.generate(prompt)
+    
+    var text = ""
+    for try await chunk in stream {
+        text += "\(chunk)"
+    }
+    return text
+}
+
 @available(macOS 26.0, *)
 func generate(prompt: String) async {
     do {
-        // Initialize the model configuration
-        let config = LanguageModelConfiguration()
-        
-        // Create a session
-        let session = try await LanguageModelSession(configuration: config)
-        
-        // Generate text
-        let stream = try await session.generate(prompt)
-        
-        for try await chunk in stream {
-            print(chunk, terminator: "")
-        }
-        print("") // Ensure newline at end
+        print(try await respond(to: prompt))
     } catch {
         print("Error: \(error)")
         exit(1)
     }
 }
 
+/// Write one JSON object as a single line on stdout.
+func reply(_ object: [String: String]) {
+    let data = (try? JSONSerialization.data(withJSONObject: object)) ?? Data("{}".utf8)
+    print(String(decoding: data, as: UTF8.self))
+    fflush(stdout)
+}
+
+/// `--serve`: handle {"prompt": ...} requests, one JSON line each, on stdin
+/// and answer each with {"text": ...} or {"error": ...} until EOF. Keeps the
+/// interpreter warm between summaries.
+@available(macOS 26.0, *)
+func serve() {
+    while let line = readLine() {
+        guard
+            let data = line.data(using: .utf8),
+            let request = try? JSONSerialization.jsonObject(with: data) as? [String: Any],
+            let prompt = request["prompt"] as? String
+        else {
+            reply(["error": "invalid request"])
+            continue
+        }
+
+        let semaphore = DispatchSemaphore(value: 0)
+        Task {
+            do {
+                reply(["text": try await respond(to: prompt)])
+            } catch {
+                reply(["error": "\(error)"])
+            }
+            semaphore.signal()
+        }
+        semaphore.wait()
+    }
+}
+
 // Main entry point
 if #available(macOS 26.0, *) {
     let args = CommandLine.arguments
@@ -32,6 +73,10 @@ if #available(macOS 26.0, *) {
         // Just checking if we can import and run.
         exit(0)
     }
+    if args.count > 1 && args[1] == "--serve" {
+        serve()
+        exit(0)
+    }
 
     guard args.count > 1 else {
         print("Usage: afm-wrapper <prompt>")
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
+import shlex
 import subprocess
 
 logging.basicConfig(
@@ -14,14 +16,41 @@ logging.basicConfig(
 logger = logging.getLogger("acc.spawner")
 
 from acc.config import ACCConfig
+from acc.tmux_client import control
+
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
 
 
 def _slugify(text: str) -> str:
     """Convert text to a tmux-friendly window name slug."""
-    slug = text.lower().strip()
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
-    slug = slug.strip("-")
-    return slug[:40] or "session"
+    # Surrounding whitespace becomes a leading/trailing "-", so the one
+    # strip("-") covers what a separate .strip() used to
+    return _SLUG_RE.sub("-", text.lower()).strip("-")[:40] or "session"
+
+
+def _tmux(*args: str, timeout: float = 10) -> tuple[bool, str]:
+    """Run a tmux command: (succeeded, stdout, or the error on failure).
+
+    Goes over the shared control-mode client when it's up, so a spawn
+    doesn't fork `tmux` up to three times; otherwise runs `tmux` directly.
+    A command the client took but didn't answer in time isn't rerun, since
+    a late `new-window` would then open a second agent window.
+    """
+    try:
+        result = control.call(*args, timeout=timeout)
+    except TimeoutError as e:
+        logger.warning("%s", e)
+        return False, str(e)
+    if result is not None:
+        return result
+    proc = subprocess.run(["tmux", *args], capture_output=True, text=True, timeout=timeout)
+    return proc.returncode == 0, proc.stdout if proc.returncode == 0 else proc.stderr
+
+
+# Sessions known to exist, so repeated spawns skip the has-session fork.
+# An entry is dropped again if new-window fails against it.
+_KNOWN_SESSIONS: set[str] = set()
 
 
 def _ensure_session(session_name: str) -> bool:
@@ -29,19 +58,16 @@ def _ensure_session(session_name: str) -> bool:
 
     Returns True if session exists or was created.
     """
-    result = subprocess.run(
-        ["tmux", "has-session", "-t", session_name],
-        capture_output=True,
-    )
-    if result.returncode == 0:
+    if session_name in _KNOWN_SESSIONS:
         return True
 
-    # Create a new detached session
-    result = subprocess.run(
-        ["tmux", "new-session", "-d", "-s", session_name],
-        capture_output=True,
-    )
-    return result.returncode == 0
+    if not _tmux("has-session", "-t", session_name)[0]:
+        # Create a new detached session
+        if not _tmux("new-session", "-d", "-s", session_name)[0]:
+            return False
+
+    _KNOWN_SESSIONS.add(session_name)
+    return True
 
 
 def spawn_session(
@@ -65,18 +91,24 @@ def spawn_session(
         config = ACCConfig()
 
     session_name = config.tmux_session
-    claude_path = config.claude_path
     window_name = _slugify(goal)
 
-    # Build claude command
-    all_args = list(config.default_claude_args)
-    if extra_args:
-        all_args.extend(extra_args)
-
-    args_str = " ".join(all_args) if all_args else ""
-    prompt_escaped = goal.replace("'", "'\\''")
+    # tmux -c silently falls back to another cwd for a missing directory
+    cwd = os.path.expanduser(working_dir)
+    if not os.path.isdir(cwd):
+        logger.error("Working directory does not exist: %s", cwd)
+        return None
 
-    command = f"cd {working_dir} && {claude_path} {args_str} -p '{prompt_escaped}'"
+    # Build claude command. The path and each arg are split shell-style,
+    # as they were when the command went through `sh -c` (e.g.
+    # CLAUDE_PATH="npx claude", or an arg entry "--model opus").
+    try:
+        argv = shlex.split(config.claude_path)
+        for arg in [*config.default_claude_args, *(extra_args or ())]:
+            argv.extend(shlex.split(arg))
+    except ValueError as e:
+        logger.error("Invalid claude command line: %s", e)
+        return None
 
     # Ensure the tmux session exists
     if not _ensure_session(session_name):
@@ -84,28 +116,29 @@ def spawn_session(
         return None
 
     # Create new window
-    result = subprocess.run(
-        [
-            "tmux",
-            "new-window",
-            "-t",
-            session_name,
-            "-n",
-            window_name,
-            "-P",
-            "-F",
-            "#{session_name}:#{window_index}.#{pane_index}",
-            command,
-        ],
-        capture_output=True,
-        text=True,
-        timeout=10,
+    ok, output = _tmux(
+        "new-window",
+        "-t",
+        session_name,
+        "-c",
+        cwd,
+        "-n",
+        window_name,
+        "-P",
+        "-F",
+        "#{session_name}:#{window_index}.#{pane_index}",
+        # Passed as separate arguments, so tmux execs claude directly (no sh -c)
+        *argv,
+        "-p",
+        goal,
     )
 
-    if result.returncode != 0:
-        logger.error("tmux new-window failed: %s", result.stderr)
+    if not ok:
+        logger.error("tmux new-window failed: %s", output)
+        # The session may have been killed since we cached it
+        _KNOWN_SESSIONS.discard(session_name)
         return None
 
-    pane_id = result.stdout.strip()
+    pane_id = output.strip()
     logger.info("Spawned session %s window %s -> pane %s", session_name, window_name, pane_id)
     return pane_id or None
@@ -2,10 +2,24 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import re
 import time
 from enum import Enum
 
 from acc.agents import AgentDetector
+from acc.text import tail_lines
+
+try:
+    from xxhash import xxh3_64_intdigest as _xxh3_64
+except ImportError:  # optional; blake2b is used instead
+    _xxh3_64 = None
+
+try:
+    import hyperscan
+except ImportError:  # optional; the merged `re` patterns are used instead
+    hyperscan = None
 
 
 class SessionStatus(Enum):
@@ -17,6 +31,8 @@ class SessionStatus(Enum):
     DONE = "done"
     CRASHED = "crashed"
 
+    code: int  # dense small-int id, assigned below
+
     @property
     def icon(self) -> str:
         return _STATUS_ICONS[self]
@@ -42,6 +58,12 @@ _STATUS_LABELS = {
     SessionStatus.CRASHED: "Crashed",
 }
 
+# Codes follow definition order. Ints hash in C, while hashing a member
+# goes through Enum.__hash__, so hot lookups key on `code`.
+for _code, _status in enumerate(SessionStatus):
+    _status.code = _code
+del _code, _status
+
 IDLE_TIMEOUT_SECONDS = 30.0
 
 
@@ -65,35 +87,81 @@ def detect_status(
     Returns:
         The detected SessionStatus.
     """
-    # Process exited
-    if not agent_running:
-        if exit_code is not None and exit_code != 0:
-            return SessionStatus.CRASHED
-        return SessionStatus.DONE
+    content_status = classify_content(pane_content, detector) if agent_running else None
+    return resolve_status(content_status, agent_running, exit_code, last_output_time)
+
+
+# Most characters of pane content classify_content looks at. Indicators
+# sit on the last few lines; this bounds the strip/scan work when those
+# lines are enormous (or the caller passes a whole scrollback).
+_TAIL_CHARS = 4096
+
+
+def classify_content(
+    pane_content: str, detector: AgentDetector | None = None
+) -> SessionStatus | None:
+    """Classify pane content on its own, ignoring process state and time.
 
-    # Process is alive — check content for clues
-    lines = pane_content.strip().splitlines()
-    tail = "\n".join(lines[-10:]) if lines else ""
+    Returns WORKING or NEEDS_ATTENTION if an indicator pattern matches,
+    otherwise None. The result depends only on the content and detector,
+    so callers can cache it until the content changes.
+
+    Only the last 10 lines are examined, and of those only the ones
+    reaching into the last `_TAIL_CHARS` characters (whole lines).
+    """
+    if len(pane_content) > _TAIL_CHARS:
+        # Cut at the line boundary before the last _TAIL_CHARS characters:
+        # the line the cut would split is kept whole, so neither an
+        # indicator at its end nor line-anchored patterns are thrown off
+        start = pane_content.rfind("\n", 0, len(pane_content) - _TAIL_CHARS)
+        pane_content = pane_content[start + 1:]
+    tail = tail_lines(pane_content.strip(), 10)
 
     # Use detector patterns if available
-    attention_patterns = (
-        detector.attention_patterns if detector else _DEFAULT_ATTENTION_PATTERNS
-    )
-    working_patterns = (
-        detector.working_patterns if detector else _DEFAULT_WORKING_PATTERNS
-    )
+    attention = tuple(detector.attention_patterns if detector else _DEFAULT_ATTENTION_PATTERNS)
+    working = tuple(detector.working_patterns if detector else _DEFAULT_WORKING_PATTERNS)
+    literals = detector.prefilter_literals if detector else _DEFAULT_PREFILTER_LITERALS
+
+    # Hyperscan's caseless mode doesn't fold the Turkish dotted/dotless i
+    # the way `re` does, so such tails take the `re` path
+    db = None if "İ" in tail or "ı" in tail else _hyperscan_db(working, attention)
+    if db is not None:
+        status = _hyperscan_classify(db, len(working), tail)
+        if status is not False:
+            return status
+
+    # Patterns with declared literals are gated on them; the rest run
+    # merged into one regex per list
+    folded: list[str] = []
 
     # Check for active working indicators FIRST — a visible spinner/progress
     # means the agent is busy even if its input prompt is also visible
     # (e.g. Claude always shows ❯ prompt, even while compacting).
-    for pat in working_patterns:
-        if pat.search(tail):
-            return SessionStatus.WORKING
+    if _search_any(_scan_plan(working, tuple(map(literals.get, working))), tail, folded):
+        return SessionStatus.WORKING
 
     # Only check attention patterns if no working indicator was found
-    for pat in attention_patterns:
-        if pat.search(tail):
-            return SessionStatus.NEEDS_ATTENTION
+    if _search_any(_scan_plan(attention, tuple(map(literals.get, attention))), tail, folded):
+        return SessionStatus.NEEDS_ATTENTION
+
+    return None
+
+
+def resolve_status(
+    content_status: SessionStatus | None,
+    agent_running: bool,
+    exit_code: int | None,
+    last_output_time: float,
+) -> SessionStatus:
+    """Combine a `classify_content` result with process state and idle time."""
+    # Process exited
+    if not agent_running:
+        if exit_code is not None and exit_code != 0:
+            return SessionStatus.CRASHED
+        return SessionStatus.DONE
+
+    if content_status is not None:
+        return content_status
 
     # Check idle timeout
     elapsed = time.time() - last_output_time
@@ -104,24 +172,202 @@ def detect_status(
     return SessionStatus.WORKING
 
 
-# Fallback patterns when no detector is available
-import re
-
-_DEFAULT_ATTENTION_PATTERNS = [
-    re.compile(r"\?\s*$", re.MULTILINE),
-    re.compile(r"(?:Y/n|y/N|yes/no)", re.IGNORECASE),
-    re.compile(r"\(Y\)es.*\(N\)o", re.IGNORECASE),
-    re.compile(r"^[❯>›\$]\s*$", re.MULTILINE),
+# Fallback patterns when no detector is available, with their prefilter
+# literals (see AgentDetector.prefilter_literals)
+_DEFAULT_ATTENTION = [
+    (re.compile(r"\?\s*$", re.MULTILINE), ("?",)),
+    (re.compile(r"(?:Y/n|y/N|yes/no)", re.IGNORECASE), ("y/n", "yes/no")),
+    (re.compile(r"\(Y\)es.*\(N\)o", re.IGNORECASE), ("(y)es",)),
+    (re.compile(r"^[❯>›\$]\s*$", re.MULTILINE), ("❯", ">", "›", "$")),
 ]
 
-_DEFAULT_WORKING_PATTERNS = [
-    re.compile(r"[⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏]"),
-    re.compile(r"\.{3,}"),
-    re.compile(r"[█▓▒░]"),
+_DEFAULT_WORKING = [
+    (re.compile(r"[⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏]"), tuple("⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏")),
+    (re.compile(r"\.{3,}"), ("...",)),
+    (re.compile(r"[█▓▒░]"), tuple("█▓▒░")),
 ]
 
+_DEFAULT_ATTENTION_PATTERNS = [pat for pat, _ in _DEFAULT_ATTENTION]
+_DEFAULT_WORKING_PATTERNS = [pat for pat, _ in _DEFAULT_WORKING]
+_DEFAULT_PREFILTER_LITERALS = dict(_DEFAULT_ATTENTION + _DEFAULT_WORKING)
+
+
+def _fold(text: str) -> str:
+    """Lowercase `text` so ASCII literals can be tested for IGNORECASE patterns.
 
-def content_changed(old_hash: int, new_content: str) -> tuple[bool, int]:
-    """Check if pane content has changed. Returns (changed, new_hash)."""
-    new_hash = hash(new_content)
+    Besides their ASCII case partners, `re` lets i/k/s match "İ", "ı", "K"
+    and "ſ" case-insensitively; `lower()` maps K to k, and the rest are
+    mapped here (dropping U+0307 only adds false positives, which are fine).
+    """
+    return text.lower().replace("ı", "i").replace("ſ", "s").replace("\u0307", "")
+
+
+@functools.lru_cache(maxsize=64)
+def _scan_plan(
+    patterns: tuple[re.Pattern, ...], literals: tuple[tuple[str, ...] | None, ...]
+):
+    """Split patterns into literal-gated ones and a merged always-run rest.
+
+    `literals` holds each pattern's declared prefilter literals, or None.
+    IGNORECASE patterns are gated on folded literals, so only ASCII ones
+    (whose case variants `_fold` covers) can gate them.
+    """
+    gated = []
+    rest = []
+    for pat, lits in zip(patterns, literals):
+        fold = bool(pat.flags & re.IGNORECASE)
+        if not lits or (fold and not all(lit.isascii() for lit in lits)):
+            rest.append(pat)
+        else:
+            gated.append((pat, tuple(map(_fold, lits)) if fold else lits, fold))
+    return tuple(gated), _union(tuple(rest))
+
+
+def _search_any(plan, text: str, folded: list[str]) -> bool:
+    """True if any planned pattern matches `text`.
+
+    A gated pattern only runs when one of its literals occurs in `text`
+    (or its folded form, computed at most once per call via `folded`) —
+    an `in` test is far cheaper than a regex walk, and most pane tails
+    contain none of the literals.
+    """
+    gated, rest = plan
+    for pat, literals, fold in gated:
+        if fold:
+            if not folded:
+                folded.append(_fold(text))
+            haystack = folded[0]
+        else:
+            haystack = text
+        if any(lit in haystack for lit in literals) and pat.search(text):
+            return True
+    return any(pat.search(text) for pat in rest)
+
+
+_HYPERSCAN_FLAGS = (
+    (re.IGNORECASE, "HS_FLAG_CASELESS"),
+    (re.MULTILINE, "HS_FLAG_MULTILINE"),
+    (re.DOTALL, "HS_FLAG_DOTALL"),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _hyperscan_db(
+    working: tuple[re.Pattern, ...], attention: tuple[re.Pattern, ...]
+):
+    """Compile both pattern lists into one Hyperscan database (working first).
+
+    Hyperscan matches every pattern in a single DFA pass over the text.
+    Returns None when `hyperscan` isn't installed or a pattern uses syntax
+    it doesn't support (lookarounds, backreferences, empty matches,
+    verbose mode, ...); callers then use the `re` patterns.
+    """
+    if hyperscan is None:
+        return None
+    patterns = working + attention
+    base = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_SINGLEMATCH
+    flags = []
+    for pat in patterns:
+        if pat.flags & re.VERBOSE:
+            return None
+        # Unicode classes (\w, \d, caseless) unless the pattern asked for ASCII
+        ucp = 0 if pat.flags & re.ASCII else hyperscan.HS_FLAG_UCP
+        flags.append(base | ucp | sum(
+            getattr(hyperscan, name) for flag, name in _HYPERSCAN_FLAGS if pat.flags & flag
+        ))
+    db = hyperscan.Database()
+    try:
+        db.compile(
+            expressions=[pat.pattern.encode() for pat in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=flags,
+        )
+    except hyperscan.error:
+        return None
+    return db
+
+
+def _hyperscan_classify(db, n_working: int, tail: str) -> SessionStatus | None | bool:
+    """Classify `tail` with a `_hyperscan_db` database.
+
+    Returns False if the scan itself failed (e.g. scratch in use by another
+    thread), so the caller can fall back to `re`.
+    """
+    hits: list[int] = []
+    try:
+        db.scan(tail.encode(), match_event_handler=lambda id_, *_: hits.append(id_))
+    except hyperscan.error:
+        return False
+    if not hits:
+        return None
+    # Working indicators win over attention ones, as in the `re` path
+    if min(hits) < n_working:
+        return SessionStatus.WORKING
+    return SessionStatus.NEEDS_ATTENTION
+
+
+_SCOPED_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+    (re.ASCII, "a"),
+)
+_NUMERIC_BACKREF = re.compile(r"\\[1-9]")
+
+
+@functools.lru_cache(maxsize=64)
+def _union(patterns: tuple[re.Pattern, ...]) -> tuple[re.Pattern, ...]:
+    """Merge patterns into a single alternation so one search replaces N.
+
+    Each pattern keeps its own flags via a scoped inline group, e.g.
+    `(?im:...)`. Returns the patterns unchanged if they can't be merged
+    safely (numeric backreferences, clashing group names, global inline
+    flags in a pattern, ...).
+    """
+    if len(patterns) < 2:
+        return patterns
+
+    parts = []
+    for pat in patterns:
+        if _NUMERIC_BACKREF.search(pat.pattern):
+            return patterns
+        flags = "".join(letter for flag, letter in _SCOPED_FLAGS if pat.flags & flag)
+        parts.append(f"(?{flags}:{pat.pattern})")
+    try:
+        return (re.compile("|".join(parts)),)
+    except re.error:
+        return patterns
+
+
+def content_hash(content: str) -> int:
+    """64-bit hash of pane content.
+
+    An xxh3 digest when `xxhash` is installed, otherwise a blake2b digest.
+    Either way it is stable across processes (unlike `hash()`) and can be
+    persisted alongside cached data.
+    """
+    # surrogatepass: never raise on odd captures, and stay injective
+    data = content.encode("utf-8", "surrogatepass")
+    if _xxh3_64 is not None:
+        return _xxh3_64(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def content_changed(
+    old_hash: int, new_content: str, old_content: str | None = None
+) -> tuple[bool, int]:
+    """Check if pane content has changed. Returns (changed, new_hash).
+
+    The hash is `content_hash(new_content)`.
+
+    `old_content`, the text `old_hash` was computed from, enables a fast
+    path: an unchanged pane (the common case) costs one string compare,
+    which bails out on a length mismatch, instead of re-encoding and
+    hashing the whole capture.
+    """
+    if old_hash and old_content is not None and new_content == old_content:
+        return (False, old_hash)
+    new_hash = content_hash(new_content)
     return (old_hash != new_hash, new_hash)
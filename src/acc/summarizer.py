@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import os
 import time
 import subprocess
+import tempfile
 import platform
+import queue
+import threading
 import urllib.request
 import json
+import re
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from pathlib import Path
+from typing import Iterable
+
+from acc.status import content_hash
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +40,21 @@ Terminal output:
 {content}
 """
 
+# One "Field: value" line of the response ([^\S\n] = whitespace other than newline)
+_RESPONSE_FIELD = re.compile(
+    r"^[^\S\n]*(goal|progress|needs user):[^\S\n]*(.*?)[^\S\n]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Bundled Apple Foundation Models wrapper; package files don't move at
+# runtime, so locate and stat it once
+_AFM_SCRIPT = Path(__file__).parent / "scripts" / "afm_wrapper.swift"
+_AFM_SCRIPT_EXISTS = _AFM_SCRIPT.exists()
+
+# Resolved "auto" provider per API key (the key decides the remote fallback)
+_AUTO_PROVIDERS: dict[str | None, str] = {}
+_AUTO_PROVIDER_LOCK = threading.Lock()
+
 
 @dataclass
 class SessionSummary:
@@ -38,11 +64,19 @@ class SessionSummary:
     progress: str
     needs_user: bool
     timestamp: float
+    # Hash of the prompt content the summary was made from (0 = unknown)
+    content_hash: int = 0
 
 
 class Summarizer:
     """Summarizes pane content using LLM providers (Anthropic, OpenAI/Ollama, Apple)."""
 
+    # Max summaries kept (least recently used panes are dropped first)
+    CACHE_SIZE = 256
+    # Seconds to wait for the Apple `--serve` helper's reply; same budget as
+    # the one-shot run, since local inference can be slow
+    APPLE_REPLY_TIMEOUT = 60
+
     def __init__(
         self,
         model: str = "claude-haiku-4-20250414",
@@ -58,34 +92,81 @@ class Summarizer:
         self.provider = provider.lower()
         self.provider = provider.lower()
         self._cache_file = Path.home() / ".acc" / "cache.json"
-        self._cache: dict[str, SessionSummary] = self._load_cache()
+        self._cache: OrderedDict[str, SessionSummary] = self._load_cache()
+        # Guards every _cache access: the UI thread reads (and reorders) it
+        # while pool workers store summaries and save it
+        self._cache_lock = threading.Lock()
+        # Serialises saves, so an older snapshot can't replace a newer file
+        self._save_lock = threading.Lock()
         self._client = None
-
-    def _load_cache(self) -> dict[str, SessionSummary]:
+        # Background workers can all reach _get_client before it's built
+        self._client_lock = threading.Lock()
+        # Long-lived `afm_wrapper.swift --serve` helper for provider="apple"
+        self._apple_proc: subprocess.Popen | None = None
+        self._apple_replies: queue.Queue[str | None] = queue.Queue()
+        self._apple_lock = threading.Lock()
+        self._apple_serve_broken = False
+        # Background summarization; at most one in-flight request per pane
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight: dict[str, Future] = {}
+        self._in_flight_lock = threading.Lock()
+
+    def _load_cache(self) -> OrderedDict[str, SessionSummary]:
         """Load summarized sessions from disk."""
+        cache: OrderedDict[str, SessionSummary] = OrderedDict()
         if not self._cache_file.exists():
-            return {}
+            return cache
         try:
             with open(self._cache_file, "r") as f:
                 data = json.load(f)
             
-            cache = {}
             for pane_id, summary_data in data.items():
                 cache[pane_id] = SessionSummary(**summary_data)
+            # Saved in LRU order, so the oldest entries are the ones dropped
+            while len(cache) > self.CACHE_SIZE:
+                cache.popitem(last=False)
             return cache
         except Exception as e:
             logger.warning("Failed to load cache: %s", e)
-            return {}
+            return OrderedDict()
+
+    def _peek(self, pane_id: str) -> SessionSummary | None:
+        """The cached summary for a pane, without touching its recency."""
+        with self._cache_lock:
+            return self._cache.get(pane_id)
+
+    def _store(self, pane_id: str, summary: SessionSummary) -> None:
+        """Insert a summary as most recently used, evicting past CACHE_SIZE."""
+        with self._cache_lock:
+            self._cache[pane_id] = summary
+            self._cache.move_to_end(pane_id)
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
 
     def _save_cache(self) -> None:
-        """Save summaries to disk."""
-        try:
-            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
-            data = {k: asdict(v) for k, v in self._cache.items()}
-            with open(self._cache_file, "w") as f:
-                json.dump(data, f)
-        except Exception as e:
-            logger.warning("Failed to save cache: %s", e)
+        """Save summaries to disk.
+
+        The cache is snapshotted under the lock, then written to a temp
+        file that replaces cache.json, so readers never see a partial file.
+        """
+        with self._save_lock:
+            tmp_path = None
+            try:
+                with self._cache_lock:
+                    data = {k: asdict(v) for k, v in self._cache.items()}
+                self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with tempfile.NamedTemporaryFile(
+                    "w", dir=self._cache_file.parent, prefix=".cache-", suffix=".json",
+                    delete=False,
+                ) as f:
+                    tmp_path = f.name
+                    json.dump(data, f)
+                os.replace(tmp_path, self._cache_file)
+            except Exception as e:
+                logger.warning("Failed to save cache: %s", e)
+                if tmp_path is not None:
+                    with contextlib.suppress(OSError):
+                        os.unlink(tmp_path)
 
     def _resolve_auto_provider(self) -> str:
         """Detect the best available LLM provider."""
@@ -99,12 +180,11 @@ class Summarizer:
                 major = int(release.split(".")[0])
                 major = int(release.split(".")[0])
                 if major >= 24:
-                    script_path = Path(__file__).parent / "scripts" / "afm_wrapper.swift"
-                    if script_path.exists():
+                    if _AFM_SCRIPT_EXISTS:
                         # Validate if the script actually runs (checks imports)
                         try:
                             res = subprocess.run(
-                                ["swift", str(script_path), "--check"],
+                                ["swift", str(_AFM_SCRIPT), "--check"],
                                 capture_output=True,
                                 timeout=5
                             )
@@ -139,9 +219,21 @@ class Summarizer:
         """Lazy-init the LLM client based on provider."""
         if self._client is not None:
             return self._client
-        
+        with self._client_lock:
+            if self._client is None:
+                self._build_client()
+        return self._client
+
+    def _build_client(self) -> None:
+        """Resolve the provider and construct its client into `self._client`."""
         if self.provider == "auto":
-            self.provider = self._resolve_auto_provider()
+            # Probing spawns swift / hits localhost, so do it once per process
+            with _AUTO_PROVIDER_LOCK:
+                provider = _AUTO_PROVIDERS.get(self.api_key)
+                if provider is None:
+                    provider = self._resolve_auto_provider()
+                    _AUTO_PROVIDERS[self.api_key] = provider
+            self.provider = provider
 
         try:
             if self.provider == "anthropic":
@@ -169,32 +261,158 @@ class Summarizer:
 
         except Exception as e:
             logger.warning("Failed to initialize %s client: %s", self.provider, e)
-            return None
 
-        return self._client
+    def _apple_serve(self, script_path: Path, prompt: str) -> str | None:
+        """Run a prompt through the persistent `afm_wrapper.swift --serve` process.
+
+        Requests and replies are single JSON lines. Returns None if the helper
+        can't be used, and the caller falls back to a one-shot `swift` run.
+        A helper that doesn't answer within APPLE_REPLY_TIMEOUT is killed
+        (the next prompt starts a fresh one) and the call raises.
+        """
+        with self._apple_lock:
+            if self._apple_serve_broken:
+                return None
+            proc = self._apple_proc
+            try:
+                if proc is None or proc.poll() is not None:
+                    proc = self._start_apple_proc(script_path)
+                proc.stdin.write(json.dumps({"prompt": prompt}) + "\n")
+                proc.stdin.flush()
+            except Exception as e:
+                # Old wrapper without --serve, swift missing...
+                logger.info("afm_wrapper --serve unavailable, using one-shot runs: %s", e)
+                self._apple_serve_broken = True
+                self._stop_apple_proc()
+                return None
+
+            # Lines are read on the helper's reader thread, so a hung helper
+            # or a partial line can't block here past the deadline
+            try:
+                line = self._apple_replies.get(timeout=self.APPLE_REPLY_TIMEOUT)
+            except queue.Empty:
+                logger.warning("afm_wrapper --serve timed out; restarting it")
+                self._stop_apple_proc()
+                raise RuntimeError("Apple Intelligence timed out") from None
+
+            try:
+                if line is None:
+                    raise RuntimeError("no reply from afm_wrapper --serve")
+                reply = json.loads(line)
+            except Exception as e:
+                # Exited without answering (e.g. no --serve mode), or garbage
+                logger.info("afm_wrapper --serve unavailable, using one-shot runs: %s", e)
+                self._apple_serve_broken = True
+                self._stop_apple_proc()
+                return None
+
+        if "error" in reply:
+            # The helper works; the model call itself failed
+            raise RuntimeError(f"Apple Intelligence failed: {reply['error']}")
+        return reply["text"]
+
+    def _start_apple_proc(self, script_path: Path) -> subprocess.Popen:
+        """Start the `--serve` helper and a thread queueing its reply lines."""
+        proc = self._apple_proc = subprocess.Popen(
+            ["swift", str(script_path), "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        # A fresh queue per helper, so a killed one's late output is dropped
+        replies: queue.Queue[str | None] = queue.Queue()
+        self._apple_replies = replies
+
+        def read_replies() -> None:
+            try:
+                for line in proc.stdout:
+                    replies.put(line)
+            except (OSError, ValueError):
+                pass  # pipe closed by kill()
+            replies.put(None)  # EOF
+
+        threading.Thread(target=read_replies, name="acc-afm-reader", daemon=True).start()
+        return proc
+
+    def _stop_apple_proc(self) -> None:
+        if self._apple_proc is not None:
+            self._apple_proc.kill()
+            self._apple_proc = None
+
+    def close(self) -> None:
+        """Cancel queued background summaries and stop the Apple helper process."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        with self._apple_lock:
+            self._stop_apple_proc()
 
     def should_refresh(self, pane_id: str) -> bool:
         """Check if a summary needs refreshing based on the interval."""
-        cached = self._cache.get(pane_id)
+        cached = self._peek(pane_id)
         if cached is None:
             return True
         return (time.time() - cached.timestamp) >= self.interval
 
+    def partition(
+        self, pane_ids: Iterable[str]
+    ) -> tuple[list[str], dict[str, SessionSummary]]:
+        """Split panes into those due a refresh and their cached summaries.
+
+        One pass over the cache for the whole poll instead of a
+        `should_refresh` + `get_cached` pair per pane. The cached dict
+        includes stale summaries, which are still shown until refreshed.
+        """
+        now = time.time()
+        to_refresh: list[str] = []
+        cached: dict[str, SessionSummary] = {}
+        # Runs on the UI thread while pool workers store summaries
+        with self._cache_lock:
+            for pane_id in pane_ids:
+                summary = self._cache.get(pane_id)
+                if summary is None:
+                    to_refresh.append(pane_id)
+                    continue
+                self._cache.move_to_end(pane_id)
+                cached[pane_id] = summary
+                if (now - summary.timestamp) >= self.interval:
+                    to_refresh.append(pane_id)
+        return to_refresh, cached
+
     def get_cached(self, pane_id: str) -> SessionSummary | None:
         """Get the cached summary for a pane, if available."""
-        return self._cache.get(pane_id)
+        with self._cache_lock:
+            summary = self._cache.get(pane_id)
+            if summary is not None:
+                self._cache.move_to_end(pane_id)
+        return summary
 
     def summarize(self, pane_id: str, content: str, force: bool = False) -> SessionSummary | None:
-        """Summarize pane content using the configured LLM provider."""
+        """Summarize pane content using the configured LLM provider.
+
+        `force` skips the refresh-interval check. Content identical to what
+        the cached summary was made from is never re-sent: the summary just
+        counts as fresh again.
+        """
         if not force and not self.should_refresh(pane_id):
-            return self._cache.get(pane_id)
+            return self._peek(pane_id)
+
+        excerpt = content[-3000:]
+        excerpt_hash = content_hash(excerpt)
+        with self._cache_lock:
+            cached = self._cache.get(pane_id)
+            if cached is not None and cached.content_hash == excerpt_hash:
+                cached.timestamp = time.time()
+                return cached
 
         client = self._get_client()
         if client is None:
-            return self._cache.get(pane_id)
+            return cached
 
         try:
-            prompt = _SUMMARIZE_PROMPT.format(content=content[-3000:])
+            prompt = _SUMMARIZE_PROMPT.format(content=excerpt)
             text = ""
 
             if self.provider == "anthropic":
@@ -215,38 +433,71 @@ class Summarizer:
 
             elif self.provider == "apple":
                 # Use our bundled swift wrapper script
-                # Locate the swift script relative to this file
-                # src/acc/summarizer.py -> src/acc/scripts/afm_wrapper.swift
-                script_path = Path(__file__).parent / "scripts" / "afm_wrapper.swift"
-                
-                if not script_path.exists():
-                     logger.warning("afm_wrapper.swift not found at %s", script_path)
-                     return self._cache.get(pane_id)
-
-                # Run swift script: swift src/acc/scripts/afm_wrapper.swift "prompt"
-                cmd = ["swift", str(script_path), prompt]
-                
-                # Timeout increased since local inference can be slow
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-                
-                if result.returncode != 0:
-                    logger.warning("Apple Intelligence failed: %s", result.stderr)
-                    return self._cache.get(pane_id)
-                text = result.stdout
+                # (src/acc/scripts/afm_wrapper.swift)
+                if not _AFM_SCRIPT_EXISTS:
+                     logger.warning("afm_wrapper.swift not found at %s", _AFM_SCRIPT)
+                     return self._peek(pane_id)
+
+                # Prefer the long-lived `--serve` helper; it avoids paying
+                # swift's startup on every call
+                served = self._apple_serve(_AFM_SCRIPT, prompt)
+                if served is not None:
+                    text = served
+                else:
+                    # Run swift script: swift src/acc/scripts/afm_wrapper.swift "prompt"
+                    cmd = ["swift", str(_AFM_SCRIPT), prompt]
+
+                    # Timeout increased since local inference can be slow
+                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+
+                    if result.returncode != 0:
+                        logger.warning("Apple Intelligence failed: %s", result.stderr)
+                        return self._peek(pane_id)
+                    text = result.stdout
 
             summary = self._parse_response(text)
             summary.timestamp = time.time()
-            self._cache[pane_id] = summary
+            summary.content_hash = excerpt_hash
+            self._store(pane_id, summary)
             self._save_cache()
             return summary
 
         except Exception as e:
             logger.warning("Summarization failed for %s (%s): %s", pane_id, self.provider, e)
-            return self._cache.get(pane_id)
+            return self._peek(pane_id)
+
+    def summarize_background(
+        self, pane_id: str, content: str, force: bool = False
+    ) -> SessionSummary | None:
+        """Queue `summarize` on a worker thread and return the cached summary now.
+
+        Requests for a pane that already has one in flight are dropped, so
+        slow providers never pile up duplicate calls. The result lands in the
+        cache and is picked up by the next `get_cached` / `partition`.
+        """
+        if not force and not self.should_refresh(pane_id):
+            return self._peek(pane_id)
+        with self._in_flight_lock:
+            if pane_id not in self._in_flight:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=4, thread_name_prefix="acc-llm"
+                    )
+                future = self._executor.submit(self.summarize, pane_id, content, force=True)
+                self._in_flight[pane_id] = future
+                future.add_done_callback(lambda f, pane_id=pane_id: self._finish(pane_id, f))
+        return self._peek(pane_id)
+
+    def _finish(self, pane_id: str, future: Future) -> None:
+        with self._in_flight_lock:
+            if self._in_flight.get(pane_id) is future:
+                del self._in_flight[pane_id]
 
     def invalidate(self, pane_id: str) -> None:
         """Remove cached summary for a pane."""
-        if self._cache.pop(pane_id, None):
+        with self._cache_lock:
+            removed = self._cache.pop(pane_id, None)
+        if removed:
             self._save_cache()
 
     @staticmethod
@@ -256,15 +507,14 @@ class Summarizer:
         progress = ""
         needs_user = False
 
-        for line in text.strip().splitlines():
-            line = line.strip()
-            if line.lower().startswith("goal:"):
-                goal = line.split(":", 1)[1].strip()
-            elif line.lower().startswith("progress:"):
-                progress = line.split(":", 1)[1].strip()
-            elif line.lower().startswith("needs user:"):
-                val = line.split(":", 1)[1].strip().lower()
-                needs_user = val in ("yes", "true", "y")
+        for match in _RESPONSE_FIELD.finditer(text):
+            key, value = match.group(1).lower(), match.group(2)
+            if key == "goal":
+                goal = value
+            elif key == "progress":
+                progress = value
+            else:  # needs user
+                needs_user = value.lower() in ("yes", "true", "y")
 
         return SessionSummary(
             goal=goal or "Unknown",
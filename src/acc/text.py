@@ -0,0 +1,28 @@
+"""Small string helpers shared by the poll loop, status detection and links."""
+
+from __future__ import annotations
+
+# Characters of the first slice tail_lines splits, per line asked for
+_GUESS_LINE_CHARS = 128
+
+
+def tail_lines(text: str, n: int) -> str:
+    """Return the last `n` lines of `text`, joined with "\\n".
+
+    Equal to `"\\n".join(text.splitlines()[-n:])`, so every line boundary
+    `str.splitlines` knows (\\r, \\r\\n, \\x0b, \\x0c, \\x1c-\\x1e, \\x85,
+    \\u2028, \\u2029) counts, not just "\\n". Only a slice off the end,
+    grown until it holds more than `n` lines, is split, so the cost depends
+    on the size of the tail rather than the whole capture.
+    """
+    if n <= 0:
+        return ""
+    size = max(n * _GUESS_LINE_CHARS, 1024)
+    while size < len(text):
+        # The slice's first line may be cut short; with more than `n`
+        # lines it isn't among the last `n`
+        lines = text[-size:].splitlines()
+        if len(lines) > n:
+            return "\n".join(lines[-n:])
+        size *= 4
+    return "\n".join(text.splitlines()[-n:])
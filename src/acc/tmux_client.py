@@ -0,0 +1,233 @@
+"""Persistent tmux control-mode client.
+
+A `tmux -C` client answers the commands written to its stdin in order,
+each framed by `%begin` and `%end` (or `%error`) lines, so one long-lived
+process replaces a fork+exec of `tmux` per command. Callers fall back to
+running `tmux` directly whenever control mode isn't usable.
+
+The client is a real attached client, so it attaches to a dedicated
+`CONTROL_SESSION` (created on demand, never when no tmux server is
+running). The user's sessions keep their `#{session_attached}` and
+`destroy-unattached` behaviour; what remains visible is that session in
+`list-sessions`/`list-clients`, and global client-attached/detached
+hooks firing when the client starts and stops. The session has
+`destroy-unattached` set, so it goes away with its last acc client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, InvalidStateError, TimeoutError as FutureTimeoutError
+
+logger = logging.getLogger("acc.tmux_client")
+
+# Seconds to wait before retrying after the client couldn't start (e.g.
+# no tmux server yet), so polls don't pay for a doomed spawn every time
+_RETRY_DELAY = 5.0
+
+# Session the control client attaches to; discovery skips its pane
+CONTROL_SESSION = "__acc_ctl"
+
+# has-session fails without a server, so the client never starts one.
+# ignore-size/no-output: don't resize windows or stream pane output back
+# to us; commands can still target panes in any session.
+_CLIENT_ARGV = [
+    "tmux", "-C", "has-session", ";",
+    "new-session", "-A", "-s", CONTROL_SESSION, "-f", "ignore-size,no-output", "cat", ";",
+    "set-option", "destroy-unattached", "on",
+]
+
+
+def _resolve(future: Future, result: tuple[bool, str] | None) -> None:
+    try:
+        future.set_result(result)
+    except InvalidStateError:
+        pass  # cancelled by a timed-out `run_async`
+
+
+def _quote(arg: str) -> str:
+    """Quote one argument for tmux's command parser, so it's taken literally.
+
+    Inside single quotes tmux expands nothing (`$VAR`, `~`, `#{...}` stay
+    as-is); an embedded `'` closes the quote and is escaped outside it, and
+    a trailing `;` is escaped too rather than left where it could end a
+    command.
+    """
+    trailer = ""
+    if arg.endswith(";"):
+        arg, trailer = arg[:-1], "\\;"
+    return "'" + arg.replace("'", "'\\''") + "'" + trailer
+
+
+def _stdout(result: tuple[bool, str] | None) -> str | None:
+    if result is None:
+        return None
+    ok, output = result
+    return output if ok else ""
+
+
+class TmuxControl:
+    """A lazily started, self-restarting `tmux -C` client.
+
+    `submit` queues a command and returns a Future for its outcome:
+    (succeeded, output), where output is the error message on failure, or
+    None if the client went away before answering.
+    """
+
+    def __init__(self) -> None:
+        self._proc: subprocess.Popen | None = None
+        self._pending: deque[Future] = deque()
+        self._lock = threading.Lock()
+        self._retry_at = 0.0
+        # Whether the last client failed without answering anything; only
+        # repeat failures wait _RETRY_DELAY, so the first start after a
+        # tmux server comes up isn't held back
+        self._failed = False
+
+    def _armed_retry_at(self) -> float:
+        """Next start time after a failure. Call with the lock held."""
+        delay = _RETRY_DELAY if self._failed else 0.0
+        self._failed = True
+        return time.monotonic() + delay
+
+    def _ensure_started(self) -> subprocess.Popen | None:
+        """The running client, starting one if needed. Call with the lock held."""
+        proc = self._proc
+        if proc is not None and proc.poll() is None:
+            return proc
+        if time.monotonic() < self._retry_at:
+            return None
+        try:
+            proc = subprocess.Popen(
+                _CLIENT_ARGV,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            self._retry_at = self._armed_retry_at()
+            return None
+        self._proc = proc
+        self._pending = deque()
+        threading.Thread(
+            target=self._read_responses,
+            args=(proc, self._pending),
+            name="acc-tmux-control",
+            daemon=True,
+        ).start()
+        return proc
+
+    def _read_responses(self, proc: subprocess.Popen, pending: deque[Future]) -> None:
+        """Resolve `pending` futures from the client's framed output, in order."""
+        block: list[str] | None = None
+        guard: list[str] = []
+        ours = False
+        for raw in proc.stdout:
+            line = raw.decode(errors="replace").rstrip("\n")
+            if block is None:
+                # Outside a block: notifications (%session-changed, ...)
+                if line.startswith("%begin "):
+                    fields = line.split(" ")
+                    # %begin <time> <command number> <flags>; flag 1 marks
+                    # commands sent by this client (the startup ones are 0)
+                    guard = fields[1:3]
+                    ours = len(fields) > 3 and fields[3] == "1"
+                    block = []
+                continue
+            # Pane text can look like a guard line; only the one echoing
+            # this block's time and command number closes it
+            if line.startswith(("%end ", "%error ")) and line.split(" ")[1:3] == guard:
+                if ours and pending:
+                    self._failed = False
+                    _resolve(pending.popleft(), (line.startswith("%end "), "\n".join(block)))
+                block = None
+            else:
+                block.append(line)
+
+        with self._lock:
+            if self._proc is proc:
+                self._proc = None
+                self._retry_at = self._armed_retry_at()
+            while pending:
+                _resolve(pending.popleft(), None)
+        logger.debug("tmux control client exited (%s)", proc.wait())
+
+    def submit(self, *args: str) -> Future[tuple[bool, str] | None] | None:
+        """Queue one tmux command. Returns None if control mode can't take it.
+
+        Commands are line-oriented and answered one block each, so
+        arguments containing newlines or `;` command chains aren't sent.
+        """
+        if any("\n" in arg for arg in args) or ";" in args:
+            return None
+        line = " ".join(_quote(arg) for arg in args) + "\n"
+        future: Future[tuple[bool, str] | None] = Future()
+        with self._lock:
+            proc = self._ensure_started()
+            if proc is None:
+                return None
+            # Queue before writing, so the reader can never see the answer first
+            self._pending.append(future)
+            try:
+                proc.stdin.write(line.encode())
+                proc.stdin.flush()
+            except (BrokenPipeError, OSError):
+                self._pending.remove(future)
+                self._proc = None
+                return None
+        return future
+
+    def call(self, *args: str, timeout: float = 5) -> tuple[bool, str] | None:
+        """Run a command and wait for (succeeded, output); None if control mode failed.
+
+        Raises TimeoutError if the command was sent but not answered within
+        `timeout`. tmux may still run it, so callers must not simply rerun
+        a command with side effects.
+        """
+        future = self.submit(*args)
+        if future is None:
+            return None
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            raise TimeoutError(f"tmux {args[0]} sent but not answered within {timeout}s") from None
+
+    def run(self, *args: str, timeout: float = 5) -> str | None:
+        """Like `call`, but just the stdout ("" if the command failed).
+
+        For read-only commands: a timeout returns None too, so the caller
+        can fall back to running `tmux` itself.
+        """
+        try:
+            return _stdout(self.call(*args, timeout=timeout))
+        except TimeoutError:
+            return None
+
+    async def run_async(self, *args: str, timeout: float = 5) -> str | None:
+        """Async variant of `run`."""
+        future = self.submit(*args)
+        if future is None:
+            return None
+        try:
+            return _stdout(await asyncio.wait_for(asyncio.wrap_future(future), timeout))
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        """Detach the client; it is restarted on the next command."""
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is not None:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+
+
+# Shared by discovery, capture and send-keys
+control = TmuxControl()
@@ -6,6 +6,8 @@ from textual.widgets import Static
 
 from acc.discovery import Session
 
+_RULE = "─" * 60
+
 
 class DetailPanel(Static):
     """Panel showing details for the currently selected session."""
@@ -24,9 +26,30 @@ class DetailPanel(Static):
 
     def __init__(self) -> None:
         super().__init__("Select a session to view details")
+        # Inputs of the last render; the panel is refreshed every poll, but
+        # only re-rendered when something it shows has changed
+        self._last_key: tuple | None = None
 
     def show_session(self, session: Session | None) -> None:
         """Update the panel with session details."""
+        if session is None:
+            key: tuple = ()
+        else:
+            key = (
+                session.pane_id,
+                session.status,
+                session.goal,
+                session.progress,
+                session.session_name,
+                session.window_index,
+                session.pane_index,
+                # Replaced (not mutated) on rescan; compared element-wise
+                session.links,
+            )
+        if key == self._last_key:
+            return
+        self._last_key = key
+
         if session is None:
             self.update("No session selected")
             return
@@ -45,7 +68,7 @@ class DetailPanel(Static):
 
         text = (
             f"[bold]Session Detail — {goal_line}[/bold]\n"
-            f"{'─' * 60}\n"
+            f"{_RULE}\n"
             f"  Status:   {status_line}\n"
             f"  Goal:     {goal_line}\n"
             f"  Progress: {progress_line}\n"
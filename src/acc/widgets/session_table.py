@@ -5,11 +5,28 @@ from __future__ import annotations
 from textual.widgets import DataTable
 from textual.message import Message
 
-from acc.columns import ColumnRegistry, create_default_registry
+from acc.columns import ColumnDef, ColumnRegistry, create_default_registry
 from acc.discovery import Session
 from acc.status import SessionStatus
 
 
+def _row_fingerprint(session: Session, idx: int) -> tuple:
+    """Everything the built-in column extractors read for a row.
+
+    Rows whose fingerprint is unchanged reuse their cell text instead of
+    re-running the extractors. `links` is replaced (not mutated) on
+    rescan, and equal lists compare equal element-wise.
+    """
+    return (
+        idx,
+        session.status,
+        session.agent_name,
+        session.goal,
+        session.progress,
+        session.links,
+    )
+
+
 class SessionSelected(Message):
     """Emitted when a session row is highlighted."""
 
@@ -37,6 +54,12 @@ class SessionTable(DataTable):
         super().__init__(cursor_type="row", zebra_stripes=True, **kwargs)
         self._registry = registry or create_default_registry()
         self._session_list: list[Session] = []
+        # Cell text currently shown per row, keyed by pane_id (= row key),
+        # in table order
+        self._row_cells: dict[str, list[str]] = {}
+        # Fingerprint each row's cells were extracted from (and for which columns)
+        self._row_prints: dict[str, tuple] = {}
+        self._cell_columns: list[ColumnDef] = []
 
     def on_mount(self) -> None:
         for col in self._registry.columns:
@@ -46,18 +69,66 @@ class SessionTable(DataTable):
                 self.add_column(col.header, key=col.key)
 
     def refresh_sessions(self, sessions: dict[str, Session]) -> None:
-        """Update the table with the current session list."""
+        """Update the table with the current session list.
+
+        Rows are keyed by pane_id and diffed against what is on screen:
+        only changed cells are updated and only vanished/new panes are
+        removed/added, so a steady-state poll touches (almost) nothing.
+        """
         self._session_list = list(sessions.values())
         prev_cursor = self.cursor_row
-        self.clear()
-
+        columns = self._registry.columns
+        if columns != self._cell_columns:
+            self._row_prints = {}
+            self._cell_columns = columns
+        rows: dict[str, list[str]] = {}
+        prints: dict[str, tuple] = {}
+        stale: list[Session] = []
+        stale_indexes: list[int] = []
         for idx, session in enumerate(self._session_list):
-            cells = [col.extract(session, idx) for col in self._registry.columns]
-            self.add_row(*cells)
+            pane_id = session.pane_id
+            fingerprint = _row_fingerprint(session, idx)
+            if self._row_prints.get(pane_id) == fingerprint:
+                rows[pane_id] = self._row_cells[pane_id]
+            else:
+                # Placeholder keeps table order; filled in below
+                rows[pane_id] = []
+                stale.append(session)
+                stale_indexes.append(idx)
+            prints[pane_id] = fingerprint
+
+        # Re-extract only the changed rows, column by column
+        by_column = self._registry.extract_all(stale, stale_indexes)
+        for session, *cells in zip(stale, *by_column.values()):
+            rows[session.pane_id] = cells
+
+        old = self._row_cells
+        kept = [pane_id for pane_id in old if pane_id in rows]
+        added = [pane_id for pane_id in rows if pane_id not in old]
+        if kept + added != list(rows):
+            # Order changed in a way remove/append can't express — rebuild
+            self.clear()
+            for pane_id, cells in rows.items():
+                self.add_row(*cells, key=pane_id)
+        else:
+            for pane_id in old:
+                if pane_id not in rows:
+                    self.remove_row(pane_id)
+            for pane_id in kept:
+                if rows[pane_id] is old[pane_id]:
+                    continue
+                for col, shown, cell in zip(columns, old[pane_id], rows[pane_id]):
+                    if cell != shown:
+                        self.update_cell(pane_id, col.key, cell)
+            for pane_id in added:
+                self.add_row(*rows[pane_id], key=pane_id)
+        self._row_cells = rows
+        self._row_prints = prints
 
         # Restore cursor position
         if self._session_list and prev_cursor < len(self._session_list):
-            self.move_cursor(row=prev_cursor)
+            if self.cursor_row != prev_cursor:
+                self.move_cursor(row=prev_cursor)
         elif self._session_list:
             self.move_cursor(row=0)
 
@@ -0,0 +1,77 @@
+"""Tests for the app's poll loop."""
+
+import asyncio
+import time
+from dataclasses import replace
+from unittest.mock import MagicMock, patch
+
+from acc.app import ACCApp
+from acc.discovery import Session, SessionRegistry
+from acc.status import SessionStatus, content_hash
+from acc.summarizer import SessionSummary
+from acc.text import tail_lines
+
+
+def _app() -> MagicMock:
+    """An ACCApp stand-in whose workers run to completion right away."""
+    app = MagicMock(_polling=False, _poll_again=False)
+    app._poll_async = lambda: ACCApp._poll_async(app)
+    app.run_worker = lambda coro, **kwargs: asyncio.run(coro)
+    return app
+
+
+def test_poll_asked_for_while_busy_runs_afterwards():
+    app = _app()
+    runs = []
+
+    async def poll_once():
+        runs.append(len(runs))
+        if len(runs) == 1:
+            # Two refreshes land mid-poll; they coalesce into one more run
+            ACCApp._poll(app)
+            ACCApp._poll(app)
+
+    app._poll_once = poll_once
+    ACCApp._poll(app)
+    assert runs == [0, 1]
+    assert not app._polling and not app._poll_again
+
+
+def test_idle_poll_runs_once():
+    app = _app()
+    runs = []
+
+    async def poll_once():
+        runs.append(1)
+
+    app._poll_once = poll_once
+    ACCApp._poll(app)
+    assert runs == [1]
+
+
+def test_settled_pane_still_gets_its_summary():
+    # An idle pane whose status was just checked and whose output is unchanged
+    session = Session("s:0.0", 1, "s", 0, 0, agent_running=True, status=SessionStatus.IDLE,
+                      last_status_check=time.time(), activity=(0, 0, 80, 24),
+                      captured_activity=(0, 0, 80, 24), captured_at=time.time(),
+                      last_capture="all done\n")
+    session.content_preview = tail_lines(session.last_capture, 50)
+    session.last_content_hash = content_hash(session.content_preview)
+    app = MagicMock()
+    app.registry = SessionRegistry()
+    app.registry.sessions[session.pane_id] = session
+    summary = SessionSummary("Fix the tests", "Done", False, time.time())
+    app.summarizer.partition.return_value = (["s:0.0"], {"s:0.0": summary})
+
+    async def no_captures(pane_ids, lines):
+        return {}
+
+    with patch("acc.app.discover_panes", return_value=[replace(session)]), \
+            patch("acc.app.capture_panes_bulk_async", no_captures), \
+            patch("acc.app.classify_content") as classify:
+        asyncio.run(ACCApp._poll_once(app))
+
+    classify.assert_not_called()  # status work skipped
+    assert session.status == SessionStatus.IDLE
+    app.summarizer.summarize_background.assert_called_once_with("s:0.0", "all done\n", force=True)
+    assert (session.goal, session.progress) == ("Fix the tests", "Done")
@@ -3,6 +3,7 @@
 import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import yaml
 
@@ -59,3 +60,35 @@ class TestACCConfig:
         config = ACCConfig.load(Path("/nonexistent/path/config.yaml"))
         assert config.claude_path == "claude"
         assert config.tmux_session == "acc"
+
+    def test_parse_cached_until_file_changes(self, tmp_path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("recent_dirs: [/a]\n")
+
+        with patch("yaml.load", wraps=yaml.load) as mock_load:
+            first = ACCConfig.load(config_file)
+            first.recent_dirs.insert(0, "/mutated")
+            second = ACCConfig.load(config_file)
+            assert mock_load.call_count == 1
+            assert second.recent_dirs == ["/a"]
+
+            config_file.write_text("recent_dirs: [/a, /b]\n")
+            third = ACCConfig.load(config_file)
+            assert mock_load.call_count == 2
+            assert third.recent_dirs == ["/a", "/b"]
+
+    def test_json_config_skips_yaml_parser(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"claude_path": "/json/claude", "recent_dirs": ["/a"]}\n')
+        # The suffix decides: JSON-looking .yaml/.yml files are still YAML
+        yaml_file = tmp_path / "config.yaml"
+        yaml_file.write_text('{"claude_path": "/yaml/claude"}\n')
+        flow_file = tmp_path / "flow.yml"
+        flow_file.write_text("{claude_path: /flow/claude}\n")  # YAML, not JSON
+
+        with patch("yaml.load", wraps=yaml.load) as mock_load:
+            assert ACCConfig.load(config_file).claude_path == "/json/claude"
+            assert mock_load.call_count == 0
+            assert ACCConfig.load(yaml_file).claude_path == "/yaml/claude"
+            assert ACCConfig.load(flow_file).claude_path == "/flow/claude"
+            assert mock_load.call_count == 2
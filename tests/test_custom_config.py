@@ -53,6 +53,12 @@ def test_default_columns_fallback():
     registry = create_default_registry(config)
     assert len(registry.columns) == 6 # #, status, agent, goal, progress, links
 
+def test_registries_are_independent():
+    first = create_default_registry()
+    second = create_default_registry()
+    first.unregister("links")
+    assert [c.key for c in second.columns][-1] == "links"
+
 def test_custom_agents(custom_config_file):
     config = ACCConfig.load(custom_config_file)
     registry = AgentRegistry(config.agents)
@@ -77,3 +83,30 @@ def test_custom_links(custom_config_file):
     links = registry.scan(text)
     assert len(links) == 1
     assert links[0].url == "TICKET-123"
+
+def test_links_cell_recomputed_when_links_replaced():
+    from acc.discovery import Session
+    from acc.links import DetectedLink
+
+    links = {c.key: c for c in create_default_registry().columns}["links"]
+    session = Session(pane_id="s:0.0", pane_pid=1, session_name="s", window_index=0, pane_index=0)
+    assert links.extract(session, 0) == "—"
+
+    session.links = [DetectedLink(url="https://x/1", label="#1", icon="🔀", plugin_name="pr")]
+    assert links.extract(session, 0) == "🔀#1"
+    session.links = [DetectedLink(url="https://x/2", label="#2", icon="🔀", plugin_name="pr")]
+    assert links.extract(session, 0) == "🔀#2"
+
+
+def test_find_detector_matches_custom_names_case_insensitively():
+    registry = AgentRegistry([{"name": "MyBot", "process_names": ["MyBot-CLI"]}])
+    assert registry.find_detector("/usr/bin/mybot-cli").name == "MyBot"
+    assert registry.find_detector("Claude").name == "Claude"
+    assert registry.find_detector("bash") is None
+
+
+def test_match_process_checks_name_and_cmdline():
+    registry = AgentRegistry([{"name": "MyBot", "process_names": ["MyBot-CLI"]}])
+    assert registry.match_process("node", "node /opt/MYBOT-cli/main.js").name == "MyBot"
+    assert registry.match_process("claude", "").name == "Claude"
+    assert registry.match_process("bash", "-bash") is None
@@ -0,0 +1,208 @@
+"""Tests for tmux pane discovery and capture."""
+
+import asyncio
+import os
+import subprocess
+import time
+from unittest.mock import patch
+
+import psutil
+import pytest
+
+from acc import procfs
+from acc.agents import AgentRegistry
+from acc.discovery import (
+    _BULK_SEP,
+    Session,
+    SessionRegistry,
+    _find_agent_in_tree,
+    _match_process,
+    _prune_agent_matches,
+    capture_panes_bulk,
+    capture_panes_bulk_async,
+    discover_panes,
+)
+from acc.tmux_client import CONTROL_SESSION
+
+
+@pytest.fixture(autouse=True)
+def no_control_mode():
+    # The marker-based paths below are what runs without a control client
+    with patch("acc.discovery.control.submit", return_value=None):
+        yield
+
+
+class TestCapturePanesBulk:
+    def test_empty_pane_list_skips_tmux(self):
+        with patch("acc.discovery._run_tmux") as mock_run:
+            assert capture_panes_bulk([]) == {}
+        mock_run.assert_not_called()
+
+    def test_single_tmux_call_for_all_panes(self):
+        output = (
+            "first pane\nline 2\n"
+            f"{_BULK_SEP}s:0.0\n"
+            "\nsecond pane\n\n"
+            f"{_BULK_SEP}s:0.1"
+        )
+        with patch("acc.discovery._run_tmux", return_value=output) as mock_run:
+            captures = capture_panes_bulk(["s:0.0", "s:0.1"])
+
+        assert mock_run.call_count == 1
+        args = mock_run.call_args.args
+        assert args.count("capture-pane") == 2
+        assert captures == {"s:0.0": "first pane\nline 2", "s:0.1": "second pane"}
+
+    def test_missing_marker_falls_back_to_single_capture(self):
+        # tmux stops the sequence when a pane vanished mid-poll
+        output = f"first pane\n{_BULK_SEP}s:0.0"
+        with patch("acc.discovery._run_tmux", return_value=output), \
+                patch("acc.discovery.capture_pane", return_value="late") as mock_capture:
+            captures = capture_panes_bulk(["s:0.0", "s:0.1"], lines=50)
+
+        mock_capture.assert_called_once_with("s:0.1", lines=50)
+        assert captures == {"s:0.0": "first pane", "s:0.1": "late"}
+
+
+class TestCapturePanesBulkAsync:
+    def test_chunks_run_concurrently_and_keep_order(self):
+        pane_ids = [f"s:0.{i}" for i in range(20)]
+
+        async def fake_run(*args):
+            targets = [args[i + 1] for i, a in enumerate(args) if a == "-t"]
+            return "\n".join(f"content {t}\n{_BULK_SEP}{t}" for t in targets)
+
+        with patch("acc.discovery._run_tmux_async", side_effect=fake_run) as mock_run:
+            captures = asyncio.run(capture_panes_bulk_async(pane_ids))
+
+        assert mock_run.call_count == 2  # 16 + 4 panes
+        assert list(captures) == pane_ids
+        assert captures["s:0.19"] == "content s:0.19"
+
+
+class TestBulkSeparator:
+    def test_pane_text_resembling_a_marker_is_kept(self):
+        output = f"ACC_SEP:s:0.1\nreal\n{_BULK_SEP}s:0.0\nsecond\n{_BULK_SEP}s:0.1"
+        with patch("acc.discovery._run_tmux", return_value=output):
+            captures = capture_panes_bulk(["s:0.0", "s:0.1"])
+        assert captures == {"s:0.0": "ACC_SEP:s:0.1\nreal", "s:0.1": "second"}
+
+
+@pytest.mark.skipif(not procfs.AVAILABLE, reason="needs Linux /proc")
+class TestAgentMatchCache:
+    def test_known_process_skips_cmdline_read(self):
+        registry = AgentRegistry([{"name": "Py", "process_names": ["python", "pytest"]}])
+        _prune_agent_matches()
+        with patch("acc.procfs.read_cmdline", wraps=procfs.read_cmdline) as mock_read:
+            first = _match_process(os.getpid(), registry)
+            second = _match_process(os.getpid(), registry)
+            assert mock_read.call_count == 1
+            # A different registry can match differently
+            assert _match_process(os.getpid(), AgentRegistry()) is None
+            assert mock_read.call_count == 2
+        assert first is second and first.name == "Py"
+
+
+class TestDiscoverPanes:
+    def test_skips_the_control_client_session(self):
+        output = f"{CONTROL_SESSION}:0.0 100\nmain:0.1 200"
+        with patch("acc.discovery._run_tmux", return_value=output), \
+                patch("acc.discovery._find_agent_in_tree", return_value=(False, None)):
+            sessions = discover_panes(AgentRegistry())
+        assert [s.pane_id for s in sessions] == ["main:0.1"]
+
+    def test_reads_activity_fields(self):
+        output = "main:0.1 100 1700000000 12 80 24"
+        with patch("acc.discovery._run_tmux", return_value=output), \
+                patch("acc.discovery._find_agent_in_tree", return_value=(False, None)):
+            [session] = discover_panes(AgentRegistry())
+        assert session.activity == (1700000000, 12, 80, 24)
+
+    def test_parses_list_panes_lines(self):
+        output = "main:0.1 100\nmy project:2.0 200\n\ngarbage\nbad:x.0 300"
+        with patch("acc.discovery._run_tmux", return_value=output), \
+                patch("acc.discovery._find_agent_in_tree", return_value=(False, None)):
+            sessions = discover_panes(AgentRegistry())
+        assert [(s.pane_id, s.session_name, s.window_index, s.pane_index, s.pane_pid)
+                for s in sessions] == [
+            ("main:0.1", "main", 0, 1, 100),
+            ("my project:2.0", "my project", 2, 0, 200),
+        ]
+
+
+class TestFindAgentInTree:
+    @pytest.mark.parametrize("snapshot", [False, True])
+    def test_exited_agent_is_not_found(self, snapshot):
+        if snapshot and not procfs.AVAILABLE:
+            pytest.skip("needs Linux /proc")
+        registry = AgentRegistry([{"name": "Sleep", "process_names": ["sleep"]}])
+
+        def find():
+            if not snapshot:
+                return _find_agent_in_tree(os.getpid(), registry)
+            procs = procfs.scan_processes()
+            return _find_agent_in_tree(os.getpid(), registry, procs, procfs.children_of(procs))
+
+        child = subprocess.Popen(["sleep", "30"])
+        try:
+            assert find()[0]
+        finally:
+            child.kill()
+        # Not waited on yet, so it's a zombie
+        while psutil.Process(child.pid).status() != psutil.STATUS_ZOMBIE:
+            time.sleep(0.01)
+        try:
+            assert find() == (False, None)
+        finally:
+            child.wait()
+
+
+class TestCaptureIsCurrent:
+    def _session(self, activity, captured_activity, captured_at):
+        return Session(
+            pane_id="s:0.0",
+            pane_pid=1,
+            session_name="s",
+            window_index=0,
+            pane_index=0,
+            activity=activity,
+            captured_activity=captured_activity,
+            captured_at=captured_at,
+        )
+
+    def test_unchanged_activity_reuses_capture(self):
+        assert self._session((100, 5, 80, 24), (100, 5, 80, 24), 101.2).capture_is_current()
+
+    def test_capture_in_the_activity_second_is_retaken(self):
+        # Output later in second 100 wouldn't move the stamp
+        assert not self._session((100, 5, 80, 24), (100, 5, 80, 24), 100.9).capture_is_current()
+
+    def test_changed_or_unknown_activity_recaptures(self):
+        assert not self._session((102, 5, 80, 24), (100, 5, 80, 24), 101.0).capture_is_current()
+        assert not self._session((100, 6, 80, 24), (100, 5, 80, 24), 101.0).capture_is_current()
+        assert not self._session(None, None, 101.0).capture_is_current()
+
+
+class TestSessionRegistry:
+    def _pane(self, pane_id, agent_running=True):
+        return Session(
+            pane_id=pane_id,
+            pane_pid=1,
+            session_name="s",
+            window_index=0,
+            pane_index=0,
+            agent_running=agent_running,
+        )
+
+    def test_update_tracks_agents_and_spawned_panes(self):
+        registry = SessionRegistry()
+        registry.track_spawned("s:0.2")
+        registry.update([self._pane("s:0.0"), self._pane("s:0.1", False), self._pane("s:0.2", False)])
+        assert list(registry.sessions) == ["s:0.0", "s:0.2"]
+        assert registry.sessions["s:0.2"].spawned_by_ccc
+        first = registry.sessions["s:0.0"]
+
+        # Vanished panes go, unless acc spawned them; known panes are updated in place
+        registry.update([self._pane("s:0.0")])
+        assert list(registry.sessions) == ["s:0.0", "s:0.2"]
+        assert registry.sessions["s:0.0"] is first
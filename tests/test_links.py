@@ -1,7 +1,14 @@
 """Tests for link detection plugins."""
 
+from unittest.mock import MagicMock, patch
+
 from acc.links import LinkRegistry
-from acc.links.github import GitHubPRPlugin, GitHubIssuePlugin
+from acc.links.generic import GenericURLPlugin
+from acc.links.github import (
+    GitHubIssuePlugin,
+    GitHubPRPlugin,
+    GitHubRepoPlugin,
+)
 from acc.links.linear import LinearPlugin
 from acc.links.localhost import LocalhostPlugin
 from acc.links.custom import load_custom_plugins
@@ -35,6 +42,22 @@ class TestGitHubIssue:
         assert links[0].label == "Issue #7"
 
 
+class TestGitHubOverlap:
+    def test_overlapping_urls_get_a_link_per_plugin(self):
+        text = (
+            "https://github.com/a/b https://github.com/a/b/pull/10/files "
+            "https://github.com/a/b/issues/3."
+        )
+        links = LinkRegistry().scan(text)
+        assert [(l.plugin_name, l.url, l.label) for l in links] == [
+            ("github-pr", "https://github.com/a/b/pull/10", "PR #10"),
+            ("github-issue", "https://github.com/a/b/issues/3", "Issue #3"),
+            ("github", "https://github.com/a/b", "a/b"),
+            ("github", "https://github.com/a/b/pull/10/files", "a/b"),
+            ("github", "https://github.com/a/b/issues/3.", "a/b"),
+        ]
+
+
 class TestLinear:
     def test_detects_ticket(self):
         plugin = LinearPlugin()
@@ -121,3 +144,89 @@ class TestLinkRegistry:
         # because GitHubPlugin runs before LocalhostPlugin
         assert links[0].url == "https://github.com/user/repo/pull/1"
         assert links[1].url == "http://localhost:3000"
+
+    def test_scan_cached_reuses_result_for_same_hash(self):
+        registry = LinkRegistry()
+        text = "PR: https://github.com/a/b/pull/10"
+        first = registry.scan_cached(hash(text), text)
+        # Same hash → cached result, text isn't re-scanned
+        second = registry.scan_cached(hash(text), "")
+        assert [l.url for l in second] == [l.url for l in first]
+        assert second is not first
+
+    def test_linear_ids_inside_urls_are_kept(self):
+        registry = LinkRegistry()
+        text = "https://github.com/a/b/pull/10/files https://linear.app/acme/issue/ENG-12/fix"
+        links = registry.scan(text)
+        assert [l.label for l in links] == ["PR #10", "a/b", "ENG-12", "linear.app/…fix"]
+
+    def test_url_nested_in_localhost_url_is_found(self):
+        registry = LinkRegistry()
+        links = registry.scan("http://localhost:3000/?redirect=https://github.com/o/r/pull/5")
+        assert [(l.plugin_name, l.url) for l in links] == [
+            ("github-pr", "https://github.com/o/r/pull/5"),
+            ("localhost", "http://localhost:3000/?redirect=https://github.com/o/r/pull/5"),
+        ]
+
+    def test_urls_between_box_drawing_chars_are_found(self):
+        registry = LinkRegistry()
+        links = registry.scan("│http://localhost:8080│https://github.com/o/r/pull/7")
+        assert [(l.plugin_name, l.url) for l in links] == [
+            ("github-pr", "https://github.com/o/r/pull/7"),
+            # The localhost pattern doesn't stop at "│" (as before)
+            ("localhost", "http://localhost:8080│https://github.com/o/r/pull/7"),
+            ("url", "http://localhost:8080"),
+        ]
+
+    def test_matches_separate_plugin_scan_on_overlapping_urls(self):
+        # The registry as a plain loop over the original, separate plugins
+        plugins = [
+            GitHubPRPlugin(), GitHubIssuePlugin(), GitHubRepoPlugin(),
+            LinearPlugin(), LocalhostPlugin(), GenericURLPlugin(),
+        ]
+
+        def reference_scan(text):
+            links, seen = [], set()
+            for plugin in plugins:
+                for link in plugin.find_links(text):
+                    if link.url.rstrip("/") not in seen:
+                        seen.add(link.url.rstrip("/"))
+                        links.append(link)
+            return [(l.plugin_name, l.url, l.label) for l in links]
+
+        registry = LinkRegistry()
+        for text in [
+            "https://github.com/a/b/pull/10/files and https://github.com/a/b/pull/10",
+            "https://github.com/a/b/issues/3#issuecomment-1 https://github.com/a/b",
+            "(https://github.com/a/b/pull/1) https://github.com/a/b/pull/2/commits/abc",
+            "https://github.com/a/b/compare/main...x/pull/4",
+            "https://github.com/a/b/pull/1,https://github.com/c/d/issues/2",
+            "http://localhost:3000/?redirect=https://github.com/o/r/pull/5",
+            "│http://localhost:8080│https://github.com/o/r/pull/7 ENG-9",
+            "https://example.com/?next=http://localhost:5173/x https://github.com/o/r/",
+            "https://linear.app/acme/issue/ENG-12/fix https://github.com/o/r/issues/8/",
+        ]:
+            found = [(l.plugin_name, l.url, l.label) for l in registry.scan(text)]
+            assert found == reference_scan(text), text
+
+    def test_plugins_without_their_literal_are_skipped(self):
+        registry = LinkRegistry()
+        for plugin in registry.plugins:
+            plugin._pattern = MagicMock(wraps=plugin._pattern)
+
+        def ran():
+            return [p.name for p in registry.plugins if p._pattern.finditer.called]
+
+        assert registry.scan("plain build output, no links") == []
+        assert ran() == []
+        links = registry.scan("see https://example.com/docs")
+        assert [l.plugin_name for l in links] == ["url"]
+        assert ran() == ["url"]
+
+    def test_iter_scan_runs_passes_lazily(self):
+        registry = LinkRegistry()
+        links = registry.iter_scan("https://github.com/a/b/pull/10 ENG-12")
+        with patch.object(LinearPlugin, "find_links", autospec=True) as linear:
+            first = next(links)
+            linear.assert_not_called()
+        assert first.label == "PR #10"
@@ -1,14 +1,24 @@
+from acc.links import LinkRegistry
 
-import unittest
-from acc.links import LinkRegistry, DetectedLink
 
-class TestLinkDeduplication(unittest.TestCase):
+class TestLinkDeduplication:
     def test_dedup_trailing_slash(self):
         registry = LinkRegistry()
         text = "Visit http://localhost:3000 and http://localhost:3000/ for more info."
         links = registry.scan(text)
         # Should be 1 link, not 2
-        self.assertEqual(len(links), 1, f"Found {len(links)} links: {[l.url for l in links]}")
+        assert len(links) == 1, f"Found {len(links)} links: {[l.url for l in links]}"
+
+    def test_dedup_host_case(self):
+        registry = LinkRegistry()
+        text = "See https://github.com/owner/repo and https://GitHub.com/owner/repo/ too."
+        links = registry.scan(text)
+        assert [l.url for l in links] == ["https://github.com/owner/repo"]
+
+    def test_dedup_keeps_path_case(self):
+        registry = LinkRegistry()
+        links = registry.scan("http://localhost:3000/Docs and http://localhost:3000/docs")
+        assert len(links) == 2
 
     def test_dedup_mixed_plugins(self):
         # GitHub plugin vs Generic plugin
@@ -32,6 +42,3 @@ class TestLinkDeduplication(unittest.TestCase):
         # This test might be tricky depending on which plugin runs first.
         # GitHubRepo runs before Generic.
         pass
-
-if __name__ == '__main__':
-    unittest.main()
@@ -0,0 +1,33 @@
+"""Tests for notification transition tracking."""
+
+from acc.discovery import Session
+from acc.notifications import NotificationManager
+from acc.status import SessionStatus
+
+
+def _session(pane_id: str, status: SessionStatus) -> Session:
+    return Session(
+        pane_id=pane_id,
+        pane_pid=1,
+        session_name="s",
+        window_index=0,
+        pane_index=0,
+        status=status,
+    )
+
+
+def test_alerts_once_per_attention_transition():
+    manager = NotificationManager()
+    a = _session("s:0.0", SessionStatus.WORKING)
+    b = _session("s:0.1", SessionStatus.IDLE)
+    assert manager.check_transitions({"s:0.0": a, "s:0.1": b}) == []
+
+    a.status = SessionStatus.NEEDS_ATTENTION
+    b.status = SessionStatus.DONE  # IDLE -> DONE isn't notified
+    assert manager.check_transitions({"s:0.0": a, "s:0.1": b}) == ["s:0.0"]
+    assert manager.check_transitions({"s:0.0": a, "s:0.1": b}) == []
+    assert manager.badge_count == 1
+
+    # Vanished panes drop their attention flag
+    assert manager.check_transitions({"s:0.1": b}) == []
+    assert manager.badge_count == 0
@@ -0,0 +1,57 @@
+"""Tests for the Linux /proc readers."""
+
+import os
+import subprocess
+import time
+
+import psutil
+import pytest
+
+from acc import procfs
+
+
+def test_parse_stat_handles_parentheses_in_comm():
+    data = b"42 (a) b (c)) S 7 42 42 0 -1 4194560 1 0 0 0 0 0 0 0 20 0 1 0 987 0 0\n"
+    assert procfs.parse_stat(data) == ("a) b (c)", 7, 987)
+
+
+@pytest.mark.skipif(not procfs.AVAILABLE, reason="needs Linux /proc")
+def test_reads_match_psutil():
+    me = psutil.Process(os.getpid())
+    comm, ppid, _ = procfs.parse_stat(procfs.read_stat(os.getpid()))
+    assert (comm, ppid) == (me.name()[:15], me.ppid())
+    assert procfs.read_cmdline(os.getpid()) == " ".join(me.cmdline())
+    assert procfs.read_stat(2**22 + 1) is None
+    assert procfs.read_cmdline(2**22 + 1) is None
+
+
+@pytest.mark.skipif(not procfs.AVAILABLE, reason="needs Linux /proc")
+def test_stat_fds_are_kept_until_unused():
+    pid = os.getpid()
+    procfs.release_unused()
+    procfs.read_stat(pid)
+    fd = procfs._stat_fds[pid]
+    procfs.release_unused()
+    assert procfs.read_stat(pid).startswith(f"{pid} (".encode())
+    assert procfs._stat_fds[pid] == fd
+    procfs.release_unused()
+    procfs.release_unused()
+    assert pid not in procfs._stat_fds
+
+
+@pytest.mark.skipif(not procfs.AVAILABLE, reason="needs Linux /proc")
+def test_scan_processes_builds_the_tree():
+    procs = procfs.scan_processes()
+    me = os.getpid()
+    assert procs[me][1] == os.getppid()
+    assert me in procfs.children_of(procs)[os.getppid()]
+
+
+@pytest.mark.skipif(not procfs.AVAILABLE, reason="needs Linux /proc")
+def test_is_alive_treats_zombies_as_gone():
+    child = subprocess.Popen(["true"])
+    while procfs.is_alive(child.pid):
+        time.sleep(0.01)  # exited but not yet reaped: a zombie
+    assert psutil.Process(child.pid).status() == psutil.STATUS_ZOMBIE
+    assert child.wait() == 0
+    assert procfs.is_alive(os.getpid())
@@ -0,0 +1,112 @@
+"""Tests for the session spawner."""
+
+import os
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from acc import spawner
+from acc.config import ACCConfig
+from acc.spawner import _ensure_session, _slugify, spawn_session
+from acc.tmux_client import TmuxControl
+
+
+@pytest.fixture(autouse=True)
+def _reset_known_sessions():
+    spawner._KNOWN_SESSIONS.clear()
+    yield
+    spawner._KNOWN_SESSIONS.clear()
+
+
+@pytest.fixture
+def no_control_mode():
+    with patch("acc.spawner.control.call", return_value=None):
+        yield
+
+
+def _completed(returncode=0, stdout=""):
+    return subprocess.CompletedProcess([], returncode, stdout=stdout, stderr="")
+
+
+class TestSlugify:
+    def test_collapses_separators(self):
+        assert _slugify("  Fix the Bug!! ") == "fix-the-bug"
+
+    def test_empty_falls_back(self):
+        assert _slugify("---") == "session"
+
+
+@pytest.mark.usefixtures("no_control_mode")
+class TestEnsureSession:
+    def test_existing_session_checked_once(self):
+        with patch("acc.spawner.subprocess.run", return_value=_completed()) as mock_run:
+            assert _ensure_session("acc")
+            assert _ensure_session("acc")
+        assert mock_run.call_count == 1
+
+    def test_failed_new_window_forgets_session(self):
+        with patch("acc.spawner.subprocess.run",
+                   side_effect=[_completed(), _completed(returncode=1)]):
+            assert spawn_session("/tmp", "goal", config=ACCConfig()) is None
+        assert "acc" not in spawner._KNOWN_SESSIONS
+
+
+class TestControlMode:
+    def test_unanswered_command_is_not_rerun(self, tmp_path, monkeypatch):
+        # A control client that takes commands and never answers them
+        fake = tmp_path / "tmux"
+        fake.write_text(
+            "#!/usr/bin/env python3\n"
+            "import sys\n"
+            "print('%begin 1 10 0\\n%end 1 10 0', flush=True)\n"
+            "for line in sys.stdin:\n"
+            "    pass\n"
+        )
+        fake.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+        client = TmuxControl()
+        monkeypatch.setattr(spawner, "control", client)
+        try:
+            with patch("acc.spawner.subprocess.run") as mock_run:
+                ok, error = spawner._tmux("new-window", "-t", "acc", timeout=0.2)
+        finally:
+            client.close()
+        assert not ok and "not answered" in error
+        mock_run.assert_not_called()
+
+    def test_spawn_runs_over_control_client(self):
+        replies = [(False, "can't find session: acc"), (True, ""), (True, "acc:3.0")]
+        with patch("acc.spawner.control.call", side_effect=replies) as mock_call, \
+                patch("acc.spawner.subprocess.run") as mock_run:
+            assert spawn_session("/tmp", "goal", config=ACCConfig()) == "acc:3.0"
+        mock_run.assert_not_called()
+        assert [c.args[0] for c in mock_call.call_args_list] == [
+            "has-session", "new-session", "new-window",
+        ]
+
+    def test_unsendable_goal_falls_back_to_tmux(self):
+        spawner._KNOWN_SESSIONS.add("acc")
+        with patch("acc.spawner.subprocess.run",
+                   return_value=_completed(stdout="acc:1.0\n")) as mock_run:
+            assert spawn_session("/tmp", "line one\nline two", config=ACCConfig()) == "acc:1.0"
+        assert mock_run.call_args.args[0][-1] == "line one\nline two"
+
+
+@pytest.mark.usefixtures("no_control_mode")
+class TestSpawnCommand:
+    def test_missing_working_dir_aborts(self, tmp_path):
+        with patch("acc.spawner.subprocess.run") as mock_run:
+            assert spawn_session(str(tmp_path / "nope"), "goal", config=ACCConfig()) is None
+        mock_run.assert_not_called()
+
+    def test_claude_path_and_args_split_like_a_shell(self):
+        spawner._KNOWN_SESSIONS.add("acc")
+        config = ACCConfig(claude_path="npx claude", default_claude_args=["--model opus"])
+        with patch("acc.spawner.subprocess.run",
+                   return_value=_completed(stdout="acc:1.0\n")) as mock_run:
+            assert spawn_session("/tmp", "it's a goal", ["--verbose"], config=config) == "acc:1.0"
+        argv = mock_run.call_args.args[0]
+        assert argv[argv.index("-F") + 2:] == [
+            "npx", "claude", "--model", "opus", "--verbose", "-p", "it's a goal",
+        ]
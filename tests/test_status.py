@@ -1,9 +1,30 @@
 """Tests for session status detection."""
 
+import re
 import time
+from unittest.mock import patch
 
-from acc.agents import ClaudeDetector, OpenCodeDetector, CodexDetector, AiderDetector
-from acc.status import SessionStatus, detect_status, content_changed
+import pytest
+
+from acc.agents import (
+    BUILTIN_DETECTORS,
+    AiderDetector,
+    ClaudeDetector,
+    CodexDetector,
+    CustomAgentDetector,
+    OpenCodeDetector,
+)
+from acc import status as status_module
+from acc.status import (
+    SessionStatus,
+    _fold,
+    _hyperscan_classify,
+    _hyperscan_db,
+    classify_content,
+    content_changed,
+    detect_status,
+    resolve_status,
+)
 
 
 class TestDetectStatus:
@@ -150,6 +171,134 @@ class TestAgentSpecificDetection:
         assert status == SessionStatus.WORKING
 
 
+class TestClassifyContent:
+    """Test the cacheable content-only part of status detection."""
+
+    def test_unmatched_content_is_none(self):
+        assert classify_content("plain output\n") is None
+
+    def test_cached_class_still_goes_idle(self):
+        # No pattern matched; the idle transition comes from time alone
+        content_status = classify_content("plain output\n")
+        status = resolve_status(
+            content_status,
+            agent_running=True,
+            exit_code=None,
+            last_output_time=time.time() - 60,
+        )
+        assert status == SessionStatus.IDLE
+
+    def test_patterns_keep_their_own_flags_when_merged(self):
+        # "yes/no" is IGNORECASE, "^❯" is MULTILINE — both must still apply
+        assert classify_content("Continue? YES/NO\nmore") == SessionStatus.NEEDS_ATTENTION
+        assert classify_content("done\n❯ \nstatus bar") == SessionStatus.NEEDS_ATTENTION
+
+    def test_ascii_flag_survives_merging(self):
+        # Under re.ASCII, \w doesn't match "é"; merged, it still must not
+        word = re.compile(r"^\w+$", re.ASCII | re.MULTILINE)
+        detector = CustomAgentDetector(attention_patterns=[re.compile(r"yes/no"), word])
+        assert classify_content("café", detector) is None
+        assert classify_content("cafe", detector) == SessionStatus.NEEDS_ATTENTION
+        assert len(status_module._union((re.compile("x"), word))) == 1
+
+    def test_literal_prefilter_keeps_case_insensitive_matches(self):
+        # "İ" and "ſ" fold to ASCII under re.IGNORECASE but not under str.lower()
+        thinking = re.compile(r"thinking", re.IGNORECASE)
+        detector = CustomAgentDetector(
+            working_patterns=[thinking], prefilter_literals={thinking: ("Thinking",)}
+        )
+        assert classify_content("THİNKING", detector) == SessionStatus.WORKING
+        yes_no = re.compile(r"yes/no", re.IGNORECASE)
+        detector = CustomAgentDetector(
+            attention_patterns=[yes_no], prefilter_literals={yes_no: ("yes/no",)}
+        )
+        assert classify_content("YEſ/NO", detector) == SessionStatus.NEEDS_ATTENTION
+
+    def test_patterns_without_required_literals_still_run(self):
+        detector = CustomAgentDetector(working_patterns=[re.compile(r"\d+%")])
+        assert classify_content("progress 42%", detector) == SessionStatus.WORKING
+
+    def test_declared_literals_never_reject_a_match(self):
+        declared = [status_module._DEFAULT_PREFILTER_LITERALS]
+        patterns = list(status_module._DEFAULT_ATTENTION_PATTERNS)
+        patterns += status_module._DEFAULT_WORKING_PATTERNS
+        for detector in BUILTIN_DETECTORS:
+            declared.append(detector.prefilter_literals)
+            patterns += detector.attention_patterns + detector.working_patterns
+        texts = [
+            "Do you want to proceed?", "Continue? (Y)es / (N)o", "❯ ", "> ", "$ ",
+            "⠋ Thinking…", "Loading...", "██▓▒░", "Tokens: 5 Model: x", "aider> ",
+            "Enter any key to continue", "waiting for input", "waiting for approval",
+            "Approve or deny", "reject", "running tests", "executing", "reading",
+            "generating processing planning", "plain output", "ſtart İt Keep going?",
+        ]
+        texts += [variant for text in list(texts)
+                  for variant in (text.upper(), text.lower(), text.swapcase(),
+                                  text.replace("s", "ſ").replace("i", "ı").replace("k", "K"))]
+        for pat in patterns:
+            # Every built-in pattern is gated
+            [literals] = {table[pat] for table in declared if pat in table}
+            fold = bool(pat.flags & re.IGNORECASE)
+            for text in texts:
+                haystack = _fold(text) if fold else text
+                if pat.search(text):
+                    assert any((_fold(lit) if fold else lit) in haystack for lit in literals), (
+                        pat, text,
+                    )
+
+    def test_only_the_end_of_long_content_is_scanned(self):
+        # Working indicators, far back (more than 10 lines up)
+        noise = ("building... " * 10 + "\n") * 2000 + "plain output\n" * 10
+        assert classify_content(noise) is None
+        assert classify_content(f"{noise}Proceed?\n") == SessionStatus.NEEDS_ATTENTION
+
+    def test_line_cut_by_the_char_limit_is_dropped(self):
+        # The cut lands just before the "> " ending a long line; that
+        # remainder must not read as a bare prompt line
+        tail = "> \n" + ("w" * 500 + "\n") * 8 + "d" * 85
+        assert len(tail) == 4096
+        assert classify_content("x" * 5000 + tail) is None
+
+    def test_indicator_ending_a_line_longer_than_the_char_limit(self):
+        # The cut lands inside the long line; its end must still be seen
+        content = "x" * 5000 + " Proceed?\nstatus bar\n"
+        assert classify_content(content) == SessionStatus.NEEDS_ATTENTION
+        detector = ClaudeDetector()
+        content = "(Y)es " + "x" * 5000 + " (N)o\nstatus bar"
+        assert classify_content(content, detector) == SessionStatus.NEEDS_ATTENTION
+
+    def test_single_line_longer_than_the_char_limit_is_kept(self):
+        # The window's only newline ends the line; nothing may be dropped
+        assert classify_content("x" * 5000 + " Proceed?\n") == SessionStatus.NEEDS_ATTENTION
+        assert classify_content("x" * 5000 + " Proceed?\n\n  \n") == (
+            SessionStatus.NEEDS_ATTENTION
+        )
+
+
+class TestHyperscanBackend:
+    """The optional Hyperscan path must agree with the `re` path."""
+
+    def test_matches_re_classification(self):
+        pytest.importorskip("hyperscan")
+        detector = ClaudeDetector()
+        db = _hyperscan_db(tuple(detector.working_patterns), tuple(detector.attention_patterns))
+        assert db is not None
+        for text, expected in [
+            ("plain output", None),
+            ("Continue? YES/NO\nmore", SessionStatus.NEEDS_ATTENTION),
+            ("⠋ Thinking\n❯ ", SessionStatus.WORKING),
+            ("done\n❯ \nstatus bar", SessionStatus.NEEDS_ATTENTION),
+        ]:
+            assert _hyperscan_classify(db, len(detector.working_patterns), text) == expected
+
+    def test_unsupported_syntax_falls_back_to_re(self):
+        pytest.importorskip("hyperscan")
+        lookahead = (re.compile(r"ready(?= now)"),)
+        assert _hyperscan_db(lookahead, ()) is None
+        detector = CustomAgentDetector(working_patterns=list(lookahead))
+        assert classify_content("ready now", detector) == SessionStatus.WORKING
+
+
 class TestContentChanged:
     """Test content change detection."""
 
@@ -162,3 +311,23 @@ class TestContentChanged:
         _, h = content_changed(0, content)
         changed, _ = content_changed(h, content)
         assert changed is False
+
+    def test_unchanged_text_skips_rehash(self):
+        content = "same content"
+        _, h = content_changed(0, content)
+        with patch("acc.status.hashlib.blake2b") as blake, \
+                patch("acc.status._xxh3_64", None):
+            changed, h2 = content_changed(h, content, old_content=content)
+        blake.assert_not_called()
+        assert (changed, h2) == (False, h)
+
+    def test_previous_text_only_short_circuits_equal_content(self):
+        _, h = content_changed(0, "old")
+        changed, h2 = content_changed(h, "new", old_content="old")
+        assert changed is True
+        assert h2 == content_changed(0, "new")[1]
+
+    def test_lone_surrogates_do_not_raise(self):
+        changed, h = content_changed(0, "bad \udcff byte")
+        assert changed is True
+        assert h != content_changed(0, "bad \udcfe byte")[1]
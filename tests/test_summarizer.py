@@ -1,5 +1,15 @@
 """Tests for the LLM summarizer."""
 
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
 from acc.summarizer import Summarizer, SessionSummary
 
 
@@ -44,3 +54,196 @@ class TestSummarizerCaching:
     def test_get_cached_returns_none_for_unknown(self):
         s = Summarizer()
         assert s.get_cached("unknown") is None
+
+    def test_partition_splits_fresh_and_stale(self):
+        s = Summarizer(interval=60)
+        s._cache = OrderedDict(
+            fresh=SessionSummary("g", "p", False, time.time()),
+            stale=SessionSummary("g", "p", False, time.time() - 120),
+        )
+        to_refresh, cached = s.partition(["fresh", "stale", "new"])
+        assert to_refresh == ["stale", "new"]
+        assert set(cached) == {"fresh", "stale"}
+
+    def test_cache_evicts_least_recently_used(self):
+        s = Summarizer()
+        s._cache = OrderedDict()
+        s.CACHE_SIZE = 2
+        s._store("a", SessionSummary("g", "p", False, 0))
+        s._store("b", SessionSummary("g", "p", False, 0))
+        s.get_cached("a")
+        s._store("c", SessionSummary("g", "p", False, 0))
+        assert list(s._cache) == ["a", "c"]
+
+    def test_unchanged_content_is_not_resent(self, monkeypatch):
+        s = Summarizer(provider="anthropic", interval=0)
+        s._cache = OrderedDict()
+        monkeypatch.setattr(s, "_save_cache", lambda: None)
+        client = MagicMock()
+        client.messages.create.return_value.content = [
+            MagicMock(text="Goal: g\nProgress: p\nNeeds user: no")
+        ]
+        s._client = client
+
+        first = s.summarize("pane-1", "same output")
+        assert s.summarize("pane-1", "same output") is first
+        assert client.messages.create.call_count == 1
+        s.summarize("pane-1", "new output")
+        assert client.messages.create.call_count == 2
+
+
+class TestAutoProvider:
+    def test_auto_provider_resolved_once_per_process(self, monkeypatch):
+        monkeypatch.setattr("acc.summarizer._AUTO_PROVIDERS", {})
+        calls = []
+
+        def fake_resolve(self):
+            calls.append(self)
+            return "apple"
+
+        monkeypatch.setattr(Summarizer, "_resolve_auto_provider", fake_resolve)
+        for _ in range(2):
+            s = Summarizer(provider="auto")
+            s._get_client()
+            assert s.provider == "apple"
+        assert len(calls) == 1
+
+
+class TestCacheConcurrency:
+    def test_saves_while_workers_store_and_ui_reads(self, tmp_path, caplog):
+        s = Summarizer()
+        s._cache = OrderedDict()
+        s._cache_file = tmp_path / "cache.json"
+        stop = threading.Event()
+
+        def worker(n):
+            for i in range(50):
+                s._store(f"pane-{n}-{i % 20}", SessionSummary("g", "p", False, i))
+                s._save_cache()
+
+        def ui():
+            while not stop.is_set():
+                s.get_cached("pane-0-1")
+                s.partition([f"pane-1-{i}" for i in range(20)])
+                time.sleep(0.0005)
+
+        reader = threading.Thread(target=ui)
+        reader.start()
+        with ThreadPoolExecutor(4) as pool:
+            list(pool.map(worker, range(4)))
+        stop.set()
+        reader.join()
+
+        assert "Failed to save cache" not in caplog.text
+        assert len(json.loads(s._cache_file.read_text())) == len(s._cache)
+        assert list(tmp_path.iterdir()) == [s._cache_file]  # no temp files left
+
+
+class TestClientInit:
+    def test_concurrent_callers_build_one_client(self, monkeypatch):
+        built = []
+        gate = threading.Barrier(4)
+
+        def fake_build(self):
+            built.append(self)
+            time.sleep(0.05)  # let the other callers reach the lock
+            self._client = "apple"
+
+        monkeypatch.setattr(Summarizer, "_build_client", fake_build)
+        s = Summarizer(provider="apple")
+
+        def call():
+            gate.wait()
+            return s._get_client()
+
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(lambda _: call(), range(4)))
+        assert results == ["apple"] * 4
+        assert len(built) == 1
+
+
+class TestAppleServe:
+    def test_reuses_one_serve_process(self, tmp_path, monkeypatch):
+        # Stand-in for `swift afm_wrapper.swift --serve`: echo prompts back
+        fake_swift = tmp_path / "swift"
+        fake_swift.write_text(
+            "#!/usr/bin/env python3\n"
+            "import json, os, sys\n"
+            "for line in sys.stdin:\n"
+            "    prompt = json.loads(line)['prompt']\n"
+            "    print(json.dumps({'text': f'{os.getpid()}:{prompt}'}), flush=True)\n"
+        )
+        fake_swift.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+
+        s = Summarizer(provider="apple")
+        try:
+            first = s._apple_serve(tmp_path / "afm_wrapper.swift", "one")
+            second = s._apple_serve(tmp_path / "afm_wrapper.swift", "two")
+        finally:
+            s.close()
+        pid = first.split(":")[0]
+        assert (first, second) == (f"{pid}:one", f"{pid}:two")
+
+    def test_falls_back_when_serve_unavailable(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PATH", str(tmp_path))  # no swift at all
+        s = Summarizer(provider="apple")
+        assert s._apple_serve(tmp_path / "afm_wrapper.swift", "x") is None
+        assert s._apple_serve_broken
+
+    def test_restarts_helper_that_stalls_mid_line(self, tmp_path, monkeypatch):
+        # First helper writes half a reply and hangs; the restart answers
+        fake_swift = tmp_path / "swift"
+        fake_swift.write_text(
+            "#!/usr/bin/env python3\n"
+            "import json, os, sys, time\n"
+            f"marker = {str(tmp_path / 'started')!r}\n"
+            "first = not os.path.exists(marker)\n"
+            "open(marker, 'a').close()\n"
+            "for line in sys.stdin:\n"
+            "    if first:\n"
+            "        sys.stdout.write('{\"text\": '); sys.stdout.flush(); time.sleep(30)\n"
+            "    print(json.dumps({'text': json.loads(line)['prompt']}), flush=True)\n"
+        )
+        fake_swift.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+
+        s = Summarizer(provider="apple")
+        s.APPLE_REPLY_TIMEOUT = 0.5
+        try:
+            started = time.monotonic()
+            with pytest.raises(RuntimeError, match="timed out"):
+                s._apple_serve(tmp_path / "afm_wrapper.swift", "one")
+            assert time.monotonic() - started < 5
+            assert s._apple_proc is None and not s._apple_serve_broken
+            assert s._apple_serve(tmp_path / "afm_wrapper.swift", "two") == "two"
+        finally:
+            s.close()
+
+
+class TestSummarizeBackground:
+    def test_dedups_in_flight_requests(self, monkeypatch):
+        import threading
+
+        s = Summarizer()
+        s._cache = OrderedDict()
+        release = threading.Event()
+        calls = []
+
+        def slow_summarize(pane_id, content, force=False):
+            calls.append(pane_id)
+            release.wait(5)
+            summary = SessionSummary(goal=content, progress="", needs_user=False,
+                                     timestamp=time.time())
+            s._store(pane_id, summary)
+            return summary
+
+        monkeypatch.setattr(s, "summarize", slow_summarize)
+        assert s.summarize_background("p1", "a") is None
+        assert s.summarize_background("p1", "b") is None  # still in flight
+        release.set()
+        s._executor.shutdown(wait=True)
+
+        assert calls == ["p1"]
+        assert s.get_cached("p1").goal == "a"
+        assert "p1" not in s._in_flight
@@ -0,0 +1,40 @@
+"""Tests for shared string helpers."""
+
+import random
+
+from acc.text import tail_lines
+
+
+def _reference(text, n):
+    return "\n".join(text.splitlines()[-n:])
+
+
+class TestTailLines:
+    def test_matches_splitlines_tail(self):
+        text = "\n".join(f"line {i}" for i in range(200))
+        for n in (1, 10, 50, 199, 200, 500):
+            assert tail_lines(text, n) == _reference(text, n)
+
+    def test_short_and_empty_input(self):
+        assert tail_lines("only", 10) == "only"
+        assert tail_lines("", 10) == ""
+        assert tail_lines("a\nb", 0) == ""
+
+    def test_trailing_newline_ends_the_last_line(self):
+        assert tail_lines("a\nb\n", 2) == "a\nb"
+
+    def test_splits_on_carriage_returns_like_splitlines(self):
+        # Progress bars redraw with \r; each redraw is its own line
+        assert tail_lines("build\n10%\r50%\r100%\r\nProceed?", 3) == "50%\n100%\nProceed?"
+        assert tail_lines("a\x0bb\x0cc d", 2) == "c\nd"
+
+    def test_long_lines_and_mixed_separators_match_splitlines(self):
+        rng = random.Random(7)
+        separators = ["\n", "\r", "\r\n", "\x0b", "\x1e", "\x85", " ", "\n\n"]
+        for _ in range(200):
+            text = "".join(
+                "x" * rng.choice([0, 3, 90, 3000]) + rng.choice(separators)
+                for _ in range(rng.randint(0, 80))
+            )
+            for n in (1, 10, 50):
+                assert tail_lines(text, n) == _reference(text, n), (text, n)
@@ -0,0 +1,125 @@
+"""Tests for the tmux control-mode client."""
+
+import os
+import subprocess
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from acc import app as app_module
+from acc.app import ACCApp
+from acc.tmux_client import TmuxControl
+
+# Stand-in for `tmux -C attach-session`: frames each command like tmux does
+FAKE_TMUX = """#!/usr/bin/env python3
+import shlex, sys
+print("%begin 1 10 0\\n%end 1 10 0\\n%session-changed $0 s", flush=True)
+for n, line in enumerate(sys.stdin, start=11):
+    args = shlex.split(line)
+    print(f"%begin 1 {n} 1")
+    if args[0] == "fail" or "%gone" in args:
+        print(f"no such thing\\n%error 1 {n} 1", flush=True)
+    elif args[0] == "exit" or "%exit" in args:
+        sys.exit()
+    elif args[0] == "stall":
+        continue  # never answered
+    else:
+        # Output that looks like a guard line must not end the block
+        print(f"%end 1 {n + 1} 1\\n" + " ".join(args[1:]) + f"\\n%end 1 {n} 1", flush=True)
+"""
+
+
+def _client(tmp_path, monkeypatch) -> TmuxControl:
+    fake = tmp_path / "tmux"
+    fake.write_text(FAKE_TMUX)
+    fake.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+    return TmuxControl()
+
+
+def test_commands_are_answered_in_order(tmp_path, monkeypatch):
+    client = _client(tmp_path, monkeypatch)
+    try:
+        futures = [client.submit("echo", f"pane {i}") for i in range(3)]
+        assert [f.result(5) for f in futures] == [
+            (True, f"%end 1 {12 + i} 1\npane {i}") for i in range(3)
+        ]
+        assert client.call("fail") == (False, "no such thing")
+        assert client.run("fail") == ""
+    finally:
+        client.close()
+
+
+def test_unanswered_commands_resolve_to_none(tmp_path, monkeypatch):
+    client = _client(tmp_path, monkeypatch)
+    assert client.run("exit") is None
+    # A first failure is retried right away; a repeat one waits
+    assert client.run("exit") is None
+    assert client.submit("echo", "x") is None
+
+
+def test_sent_but_unanswered_command_times_out(tmp_path, monkeypatch):
+    client = _client(tmp_path, monkeypatch)
+    try:
+        with pytest.raises(TimeoutError):
+            client.call("stall", timeout=0.2)
+        # Read-only callers still just get None and fall back
+        assert client.run("stall", timeout=0.2) is None
+    finally:
+        client.close()
+
+
+def test_chains_and_newlines_are_left_to_the_caller(tmp_path, monkeypatch):
+    client = _client(tmp_path, monkeypatch)
+    assert client.submit("a", ";", "b") is None
+    assert client.submit("send-keys", "two\nlines") is None
+    assert client._proc is None
+
+
+def test_arguments_are_sent_literally(tmp_path, monkeypatch):
+    client = _client(tmp_path, monkeypatch)
+    try:
+        for arg in ["a;b", "$HOME", "#{pane_id}", "it's;", "~"]:
+            ok, output = client.call("echo", arg)
+            assert (ok, output.split("\n")[-1]) == (True, arg)
+    finally:
+        client.close()
+
+
+def _send_keys(client, monkeypatch, pane_id):
+    """Run ACCApp._send_keys against `client`; returns (app stand-in, Popen mock)."""
+    monkeypatch.setattr(app_module, "tmux_control", client)
+    # Catch the one-off fallbacks without touching the client's own Popen
+    fake_subprocess = MagicMock(DEVNULL=subprocess.DEVNULL)
+    monkeypatch.setattr(app_module, "subprocess", fake_subprocess)
+    app = MagicMock()
+    answered = threading.Event()
+
+    def check(result, args):
+        ACCApp._check_send_keys(app, result, args)
+        answered.set()
+
+    app._check_send_keys = check
+    ACCApp._send_keys(app, pane_id, "hi")
+    assert answered.wait(5)
+    fake_subprocess.run.assert_not_called()  # went through control mode
+    return app, fake_subprocess.Popen
+
+
+def test_send_keys_error_is_reported(tmp_path, monkeypatch):
+    client = _client(tmp_path, monkeypatch)
+    try:
+        app, popen = _send_keys(client, monkeypatch, "%gone")
+    finally:
+        client.close()
+    app.notify.assert_called_once_with("Couldn't send to the pane: no such thing", severity="error")
+    popen.assert_not_called()
+
+
+def test_send_keys_falls_back_when_client_dies(tmp_path, monkeypatch):
+    client = _client(tmp_path, monkeypatch)
+    app, popen = _send_keys(client, monkeypatch, "%exit")
+    popen.assert_called_once()
+    assert popen.call_args.args[0] == ["tmux", "send-keys", "-t", "%exit", "--", "hi", "Enter"]
+    app.notify.assert_not_called()